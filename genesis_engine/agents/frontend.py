@@ -14,19 +14,26 @@ import json
 import asyncio
 import uuid
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, TypedDict
 from datetime import datetime
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import chain
 from enum import Enum
 import logging
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateError
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, TemplateError
 from jinja2.exceptions import TemplateNotFound, TemplateSyntaxError
 from genesis_engine.mcp.agent_base import GenesisAgent, AgentTask, TaskResult
 from genesis_templates.engine import TemplateEngine
+from genesis_engine.core.config import get_config
 from genesis_engine.core.logging import get_safe_logger  # CORRECCIÓN: Usar safe logger
 from genesis_engine.core.exceptions import GenesisException
+from genesis_engine.utils.files import write_bytes
 
 class FrontendFramework(str, Enum):
     """Frameworks de frontend soportados"""
@@ -69,6 +76,589 @@ class FrontendConfig:
     api_base_url: str = "http://localhost:8000"
     environment_vars: Dict[str, Any] = field(default_factory=dict)
 
+
+class FrontendParams(TypedDict, total=False):
+    """Parámetros aceptados por las tareas de generación de frontend"""
+    schema: Dict[str, Any]
+    stack: Dict[str, Any]
+    output_path: str
+    project_name: str
+    description: str
+    framework: str
+    state_management: str
+    ui_library: str
+    typescript: bool
+    testing_framework: str
+    pwa_enabled: bool
+    ssr_enabled: bool
+    features: List[str]
+    custom_components: List[str]
+    api_base_url: str
+    env_vars: Dict[str, Any]
+
+
+# Template de package.json por framework
+_PACKAGE_JSON_TEMPLATES: Dict[FrontendFramework, str] = {
+    FrontendFramework.NEXTJS: "frontend/nextjs/package.json.j2",
+    FrontendFramework.REACT: "frontend/react/package.json.j2",
+    FrontendFramework.VUE: "frontend/vue/package.json.j2",
+}
+
+
+# Template de Dockerfile y puerto expuesto por framework
+_DOCKERFILE_TEMPLATES: Dict[FrontendFramework, str] = {
+    FrontendFramework.NEXTJS: "frontend/nextjs/Dockerfile.j2",
+    FrontendFramework.REACT: "frontend/react/Dockerfile.j2",
+    FrontendFramework.VUE: "frontend/vue/Dockerfile.j2",
+}
+
+_DOCKERFILE_PORTS: Dict[FrontendFramework, int] = {
+    FrontendFramework.NEXTJS: 3000,
+}
+
+# Ficheros de configuración estáticos, ya codificados en UTF-8
+_NEXTJS_TSCONFIG = b"""{
+  "compilerOptions": {
+    "target": "es5",
+    "lib": ["dom", "dom.iterable", "es6"],
+    "allowJs": true,
+    "skipLibCheck": true,
+    "strict": true,
+    "forceConsistentCasingInFileNames": true,
+    "noEmit": true,
+    "esModuleInterop": true,
+    "module": "esnext",
+    "moduleResolution": "node",
+    "resolveJsonModule": true,
+    "isolatedModules": true,
+    "jsx": "preserve",
+    "incremental": true,
+    "plugins": [
+      {
+        "name": "next"
+      }
+    ],
+    "paths": {
+      "@/*": ["./*"]
+    }
+  },
+  "include": ["next-env.d.ts", "**/*.ts", "**/*.tsx", ".next/types/**/*.ts"],
+  "exclude": ["node_modules"]
+}"""
+
+_VITE_TSCONFIG = b"""{
+  "compilerOptions": {
+    "target": "ES2020",
+    "useDefineForClassFields": true,
+    "lib": ["ES2020", "DOM", "DOM.Iterable"],
+    "module": "ESNext",
+    "skipLibCheck": true,
+    "moduleResolution": "bundler",
+    "allowImportingTsExtensions": true,
+    "resolveJsonModule": true,
+    "isolatedModules": true,
+    "noEmit": true,
+    "jsx": "react-jsx",
+    "strict": true,
+    "noUnusedLocals": true,
+    "noUnusedParameters": true,
+    "noFallthroughCasesInSwitch": true
+  },
+  "include": ["src"],
+  "references": [{ "path": "./tsconfig.node.json" }]
+}"""
+
+# tsconfig.json por framework (el resto usa la variante de Vite)
+_TSCONFIGS: Dict[FrontendFramework, bytes] = {
+    FrontendFramework.NEXTJS: _NEXTJS_TSCONFIG,
+}
+
+_VUE_VITE_CONFIG = b"""import { defineConfig } from 'vite'
+import vue from '@vitejs/plugin-vue'
+
+export default defineConfig({
+  plugins: [vue()],
+})"""
+
+# Errores de render que activan los fallbacks: los de Jinja y la validación
+# de variables del engine (ValueError); el resto se propaga
+_TEMPLATE_ERRORS: Tuple[type, ...] = (TemplateError, ValueError)
+
+# next.config.js si el template falla
+_NEXT_CONFIG_FALLBACK = b"""/** @type {import('next').NextConfig} */
+const nextConfig = {
+  experimental: {
+    appDir: true,
+  },
+}
+
+module.exports = nextConfig"""
+
+# package.json de Vue si el template falla (único placeholder %s: project_name)
+_VUE_PACKAGE_JSON_FALLBACK = """{
+  "name": "%s",
+  "private": true,
+  "version": "0.0.0",
+  "type": "module",
+  "scripts": {
+    "dev": "vite",
+    "build": "vue-tsc && vite build",
+    "preview": "vite preview"
+  },
+  "dependencies": {
+    "vue": "^3.3.4"
+  },
+  "devDependencies": {
+    "@vitejs/plugin-vue": "^4.2.3",
+    "typescript": "^5.0.2",
+    "vite": "^4.4.5",
+    "vue-tsc": "^1.8.5"
+  }
+}"""
+
+# Archivos de componentes, estado y estilos con contenido fijo, ya codificados
+_HEADER_TSX = b"""export default function Header() {
+  return (
+    <header className="bg-white shadow">
+      <div className="max-w-7xl mx-auto py-6 px-4">
+        <h1 className="text-3xl font-bold text-gray-900">
+          Frontend App
+        </h1>
+      </div>
+    </header>
+  );
+}"""
+
+_REDUX_STORE_TS = b"""import { configureStore } from '@reduxjs/toolkit';
+
+export const store = configureStore({
+  reducer: {
+    // Add reducers here
+  },
+});
+
+export type RootState = ReturnType<typeof store.getState>;
+export type AppDispatch = typeof store.dispatch;"""
+
+_TAILWIND_CONFIG_JS = b"""module.exports = {
+  content: [
+    './app/**/*.{js,ts,jsx,tsx}',
+    './components/**/*.{js,ts,jsx,tsx}',
+  ],
+  theme: {
+    extend: {},
+  },
+  plugins: [],
+};"""
+
+_GLOBALS_CSS = b"""@tailwind base;
+@tailwind components;
+@tailwind utilities;"""
+
+# Archivos estáticos por framework / stack: (ruta relativa, contenido)
+_BASE_COMPONENT_FILES: Dict[FrontendFramework, Tuple[Tuple[str, bytes], ...]] = {
+    FrontendFramework.NEXTJS: (("components/layout/Header.tsx", _HEADER_TSX),),
+}
+
+_STATE_MANAGEMENT_FILES: Dict[Tuple[FrontendFramework, StateManagement], Tuple[Tuple[str, bytes], ...]] = {
+    (FrontendFramework.NEXTJS, StateManagement.REDUX_TOOLKIT): (("store/index.ts", _REDUX_STORE_TS),),
+}
+
+_UI_LIBRARY_FILES: Dict[UILibrary, Tuple[Tuple[str, bytes], ...]] = {
+    UILibrary.TAILWINDCSS: (
+        ("tailwind.config.js", _TAILWIND_CONFIG_JS),
+        ("styles/globals.css", _GLOBALS_CSS),
+    ),
+}
+
+# Estructura de directorios por framework
+_NEXTJS_DIRS = (
+    "app",
+    "components/ui",
+    "components/layout",
+    "components/features",
+    "lib",
+    "hooks",
+    "types",
+    "store",
+    "styles",
+    "public",
+    "tests",
+)
+
+_REACT_DIRS = (
+    "src/components/ui",
+    "src/components/layout",
+    "src/components/features",
+    "src/hooks",
+    "src/types",
+    "src/store",
+    "src/services",
+    "src/utils",
+    "src/styles",
+    "public",
+    "tests",
+)
+
+_VUE_DIRS = (
+    "src/components",
+    "src/views",
+    "src/router",
+    "src/store",
+    "src/composables",
+    "src/types",
+    "src/services",
+    "src/assets",
+    "public",
+    "tests",
+)
+
+
+def _leaf_directories(directories: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Quedarse solo con los directorios hoja (mkdir(parents=True) crea el resto)"""
+    return tuple(
+        directory for directory in directories
+        if not any(other.startswith(directory + "/") for other in directories)
+    )
+
+
+_DIRECTORY_LAYOUTS: Dict[FrontendFramework, Tuple[str, ...]] = {
+    FrontendFramework.NEXTJS: _leaf_directories(_NEXTJS_DIRS),
+    FrontendFramework.REACT: _leaf_directories(_REACT_DIRS),
+    FrontendFramework.VUE: _leaf_directories(_VUE_DIRS),
+}
+
+
+def _with_ancestors(directories: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Directorios hoja más todos sus ancestros (lo que crea mkdir(parents=True))"""
+    result = set()
+    for directory in directories:
+        parts = directory.split("/")
+        for depth in range(1, len(parts) + 1):
+            result.add("/".join(parts[:depth]))
+    return tuple(sorted(result))
+
+
+# Todos los directorios que existen tras _create_directory_structure
+_DIRECTORY_TREES: Dict[FrontendFramework, Tuple[str, ...]] = {
+    framework: _with_ancestors(leaves) for framework, leaves in _DIRECTORY_LAYOUTS.items()
+}
+
+
+# Archivos de la aplicación principal por framework: (ruta relativa, template)
+_MAIN_APP_TEMPLATES: Dict[FrontendFramework, Tuple[Tuple[str, str], ...]] = {
+    FrontendFramework.NEXTJS: (
+        ("app/layout.tsx", "frontend/nextjs/app/layout.tsx.j2"),
+        # app/page.tsx se reemplaza posteriormente en _generate_main_page
+        ("app/page.tsx", "frontend/nextjs/app/page.tsx.j2"),
+    ),
+    FrontendFramework.REACT: (
+        ("index.html", "frontend/react/index.html.j2"),
+        ("src/App.tsx", "frontend/react/src/App.tsx.j2"),
+        ("src/main.tsx", "frontend/react/src/main.tsx.j2"),
+    ),
+}
+
+_NEXT_CONFIG_TEMPLATE = "frontend/nextjs/next.config.js.j2"
+
+# Templates que usa el agente, compilados por adelantado en initialize()
+_WARMUP_TEMPLATES: Tuple[str, ...] = (
+    *_PACKAGE_JSON_TEMPLATES.values(),
+    *_DOCKERFILE_TEMPLATES.values(),
+    *(name for entries in _MAIN_APP_TEMPLATES.values() for _, name in entries),
+    _NEXT_CONFIG_TEMPLATE,
+)
+
+# Comandos y pasos por framework
+_BUILD_COMMANDS: Dict[FrontendFramework, str] = {
+    FrontendFramework.NEXTJS: "npm run build",
+    FrontendFramework.REACT: "npm run build",
+    FrontendFramework.VUE: "npm run build",
+}
+
+_START_COMMANDS: Dict[FrontendFramework, str] = {
+    FrontendFramework.NEXTJS: "npm start",
+    FrontendFramework.REACT: "nginx -g 'daemon off;'",
+    FrontendFramework.VUE: "nginx -g 'daemon off;'",
+}
+
+_RUN_COMMANDS: Dict[FrontendFramework, Mapping[str, str]] = {
+    FrontendFramework.NEXTJS: MappingProxyType({
+        "install": "npm install",
+        "dev": "npm run dev",
+        "build": "npm run build",
+        "start": "npm start",
+        "test": "npm test",
+        "lint": "npm run lint",
+        "docker_build": "docker build -t frontend .",
+        "docker_run": "docker run -p 3000:3000 frontend"
+    }),
+    FrontendFramework.REACT: MappingProxyType({
+        "install": "npm install",
+        "start": "npm start",
+        "build": "npm run build",
+        "test": "npm test",
+        "docker_build": "docker build -t frontend .",
+        "docker_run": "docker run -p 80:80 frontend"
+    }),
+    FrontendFramework.VUE: MappingProxyType({
+        "install": "npm install",
+        "dev": "npm run dev",
+        "build": "npm run build",
+        "preview": "npm run preview",
+        "test": "npm run test",
+        "docker_build": "docker build -t frontend .",
+        "docker_run": "docker run -p 80:80 frontend"
+    }),
+}
+
+_EMPTY_RUN_COMMANDS: Mapping[str, str] = MappingProxyType({})
+
+_BASE_NEXT_STEPS = (
+    "1. Instalar dependencias: npm install",
+    "2. Configurar variables de entorno en .env.local",
+)
+
+_NEXT_STEPS: Dict[FrontendFramework, Tuple[str, ...]] = {
+    FrontendFramework.NEXTJS: _BASE_NEXT_STEPS + (
+        "3. Iniciar servidor de desarrollo: npm run dev",
+        "4. Acceder a: http://localhost:3000",
+    ),
+    FrontendFramework.REACT: _BASE_NEXT_STEPS + (
+        "3. Iniciar servidor de desarrollo: npm start",
+        "4. Acceder a: http://localhost:3000",
+    ),
+    FrontendFramework.VUE: _BASE_NEXT_STEPS + (
+        "3. Iniciar servidor de desarrollo: npm run dev",
+        "4. Acceder a: http://localhost:5173",
+    ),
+}
+
+
+def _write_file_if_changed(path: Path, data: bytes) -> None:
+    """Escribir solo si el contenido en disco difiere (evita reescrituras al regenerar)"""
+    try:
+        # Comparar contenido solo si el tamaño coincide
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as existing:
+                if existing.read() == data:
+                    return
+    except OSError:
+        pass
+    write_bytes(path, data)
+
+
+def _write_directory_files(entries: List[Tuple[Path, bytes]]) -> None:
+    """
+    Escribir en orden los archivos de un mismo directorio
+
+    Sin fsync: como antes, la durabilidad queda a cargo del sistema operativo.
+    """
+    for path, data in entries:
+        _write_file_if_changed(path, data)
+
+
+# Tipos exactos que se memoizan: inmutables y que Jinja recibe tal cual
+_MEMO_SCALAR_TYPES: frozenset = frozenset({str, bool, int, type(None)})
+
+
+def _freeze_template_vars(template_vars: Mapping[str, Any]) -> Optional[frozenset]:
+    """
+    Convertir variables de template en una clave hashable (None si no es posible)
+
+    La clave incluye el tipo de cada valor para no confundir True, 1 y 1.0; solo
+    se admiten escalares inmutables, así el render recibe los valores originales.
+    """
+    items = []
+    for key, value in template_vars.items():
+        value_type = type(value)
+        if value_type not in _MEMO_SCALAR_TYPES:
+            return None
+        items.append((key, value_type, value))
+    return frozenset(items)
+
+
+def _first_value(candidates: Tuple[Tuple[Mapping[str, Any], str], ...], default: Any) -> Any:
+    """Primer valor no vacío entre pares (origen, clave), en orden de prioridad"""
+    for source, key in candidates:
+        value = source.get(key)
+        if value:
+            return value
+    return default
+
+
+# Lookups valor -> miembro, evitando Enum.__call__ en cada extracción
+_FRAMEWORK_BY_VALUE: Dict[str, FrontendFramework] = {f.value: f for f in FrontendFramework}
+_STATE_MANAGEMENT_BY_VALUE: Dict[str, StateManagement] = {s.value: s for s in StateManagement}
+_UI_LIBRARY_BY_VALUE: Dict[str, UILibrary] = {ui.value: ui for ui in UILibrary}
+
+_SUPPORTED_FRAMEWORKS = tuple(_FRAMEWORK_BY_VALUE)
+_SUPPORTED_UI_LIBRARIES = tuple(_UI_LIBRARY_BY_VALUE)
+
+
+def _lookup_enum(lookup: Dict[str, Enum], value: str, enum_name: str) -> Enum:
+    """Resolver un valor del stack; ValueError si no es válido (como Enum(value))"""
+    try:
+        return lookup[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {enum_name}") from None
+
+
+@lru_cache(maxsize=32, typed=True)
+def _shared_template_vars(
+    project_name: str,
+    description: str,
+    framework_value: str,
+    typescript: bool,
+    state_value: str,
+    ui_value: str,
+) -> Mapping[str, Any]:
+    """Variables comunes de template, memoizadas: proyectos repetidos reutilizan el snapshot"""
+    return MappingProxyType({
+        "project_name": project_name,
+        "description": description,
+        "framework": framework_value,
+        "typescript": typescript,
+        "state_management": state_value,
+        "ui_library": ui_value,
+        "styling": ui_value,  # NUEVA: Alias para styling
+    })
+
+
+@lru_cache(maxsize=32)
+def _parse_stack_values(
+    framework_val: str, state_management_val: str, ui_library_val: str
+) -> Tuple[FrontendFramework, StateManagement, UILibrary]:
+    """Convertir los valores del stack a enums (memoizado por combinación)"""
+    return (
+        _lookup_enum(_FRAMEWORK_BY_VALUE, framework_val, "FrontendFramework"),
+        _lookup_enum(_STATE_MANAGEMENT_BY_VALUE, state_management_val, "StateManagement"),
+        _lookup_enum(_UI_LIBRARY_BY_VALUE, ui_library_val, "UILibrary"),
+    )
+
+
+def _build_frontend_config(
+    framework_val: str,
+    state_management_val: str,
+    ui_library_val: str,
+    typescript: bool,
+    testing_framework: str,
+    pwa_enabled: bool,
+    ssr_enabled: bool,
+    features: List[str],
+    custom_components: List[str],
+    api_base_url: str,
+    environment_vars: Dict[str, Any],
+) -> FrontendConfig:
+    """Construir FrontendConfig a partir de los valores ya resueltos"""
+    framework, state_management, ui_library = _parse_stack_values(
+        framework_val, state_management_val, ui_library_val
+    )
+    return FrontendConfig(
+        framework=framework,
+        state_management=state_management,
+        ui_library=ui_library,
+        typescript=typescript,
+        testing_framework=testing_framework,
+        pwa_enabled=pwa_enabled,
+        ssr_enabled=ssr_enabled,
+        features=features,
+        custom_components=custom_components,
+        api_base_url=api_base_url,
+        environment_vars=environment_vars,
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_frontend_config(key: Tuple[Any, ...]) -> FrontendConfig:
+    """FrontendConfig memoizado por parámetros (plantilla interna: usar _copy_frontend_config)"""
+    *values, features, custom_components, api_base_url, environment_vars = key
+    return _build_frontend_config(
+        *values, list(features), list(custom_components), api_base_url, dict(environment_vars)
+    )
+
+
+def _copy_frontend_config(config: FrontendConfig) -> FrontendConfig:
+    """Copia independiente de un FrontendConfig, incluidas sus listas y diccionarios"""
+    return replace(
+        config,
+        features=list(config.features),
+        custom_components=list(config.custom_components),
+        environment_vars=dict(config.environment_vars),
+    )
+
+
+def _configure_template_engine(engine: TemplateEngine) -> TemplateEngine:
+    """Ajustar el Environment de Jinja del engine para reutilizar templates compilados"""
+    env = getattr(engine, "env", None)
+    if env is None:
+        return engine
+
+    # Los templates son estáticos: sin stat() por cada get_template
+    env.auto_reload = False
+
+    # Caché de templates compilados sin límite (equivale a cache_size=-1):
+    # el conjunto de templates es acotado y nunca se expulsan
+    if not isinstance(env.cache, dict):
+        env.cache = {}
+
+    # Bytecode compilado persistente entre ejecuciones, en el cache_dir de la
+    # configuración de Genesis; si no es usable se recurre al temporal del sistema
+    if env.bytecode_cache is None:
+        cache_dirs = [Path(tempfile.gettempdir()) / "genesis_jinja_cache"]
+        try:
+            cache_dirs.insert(0, Path(get_config().cache_dir) / "jinja")
+        except (OSError, TypeError):
+            pass
+        for cache_dir in cache_dirs:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                continue
+            if os.access(cache_dir, os.W_OK):
+                env.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+                break
+    return engine
+
+
+@lru_cache(maxsize=None)
+def _get_shared_template_engine() -> TemplateEngine:
+    """TemplateEngine compartido para compilar cada template una sola vez por proceso"""
+    engine = _configure_template_engine(TemplateEngine())
+    # Compilar al crear el engine: el primer render ya no paga parse + codegen
+    _warm_templates(engine)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def _get_render_pool() -> ThreadPoolExecutor:
+    """Pool de threads dedicado al render (las escrituras usan el executor por defecto)"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="frontend-render")
+
+
+def _warm_templates(engine: TemplateEngine) -> int:
+    """Compilar los templates conocidos en la caché del engine; devuelve cuántos cargó"""
+    env = getattr(engine, "env", None)
+    if env is None:
+        return 0
+    warmed = 0
+    for template_name in _WARMUP_TEMPLATES:
+        try:
+            env.get_template(template_name)
+        except TemplateError:
+            continue
+        warmed += 1
+    return warmed
+
+
+@lru_cache(maxsize=256)
+def _render_shared_cached(template_name: str, frozen_vars: frozenset) -> bytes:
+    """Renderizar con el engine compartido a UTF-8 memoizando por (template, variables)"""
+    engine = _get_shared_template_engine()
+    template_vars = {key: value for key, _, value in frozen_vars}
+    return engine.render_template(template_name, template_vars).encode("utf-8")
+
+
 class FrontendAgent(GenesisAgent):
     """
     Agente Frontend - CORREGIDO
@@ -79,6 +669,14 @@ class FrontendAgent(GenesisAgent):
     - Logs ASCII-safe
     """
 
+    # Pasos opcionales de _generate_complete_frontend que producen archivos;
+    # los que hoy devuelven siempre {} (routing, typescript) no se invocan
+    _IMPLEMENTED_GENERATORS: frozenset = frozenset({
+        "base_components",
+        "state_management",
+        "ui_configuration",
+    })
+
     def __init__(self):
         super().__init__(
             agent_id="frontend_agent",
@@ -104,7 +702,8 @@ class FrontendAgent(GenesisAgent):
         self.register_handler("setup_routing", self._handle_setup_routing)
         self.register_handler("generate_dockerfile", self._handle_generate_dockerfile)
 
-        self.template_engine = TemplateEngine()
+        # Engine compartido y ya ajustado; un engine asignado después se usa tal cual
+        self.template_engine = _get_shared_template_engine()
         # CORRECCIÓN: Usar safe logger
         self.logger = get_safe_logger(f"agent.{self.agent_id}")
 
@@ -114,10 +713,14 @@ class FrontendAgent(GenesisAgent):
         self.logger.info("[UI] Inicializando Frontend Agent")
 
         self.set_metadata("version", "1.0.1")
-        self.set_metadata("supported_frameworks", [f.value for f in FrontendFramework])
-        self.set_metadata("supported_ui_libraries", [ui.value for ui in UILibrary])
+        self.set_metadata("supported_frameworks", list(_SUPPORTED_FRAMEWORKS))
+        self.set_metadata("supported_ui_libraries", list(_SUPPORTED_UI_LIBRARIES))
         self.set_metadata("dockerfile_support", True)
 
+        # Compilar los templates ahora y no en la primera tarea
+        warmed = await asyncio.to_thread(_warm_templates, self.template_engine)
+        self.logger.info("[OK] %d templates precompilados", warmed)
+
         # CORRECCIÓN: Log sin emojis
         self.logger.info("[OK] Frontend Agent inicializado con soporte Docker")
 
@@ -127,7 +730,7 @@ class FrontendAgent(GenesisAgent):
 
         try:
             if "generate_frontend" in task_name:
-                result = self._generate_complete_frontend(task.params)
+                result = await self._generate_complete_frontend(task.params)
                 return TaskResult(
                     task_id=task.id,
                     success=True,
@@ -158,7 +761,7 @@ class FrontendAgent(GenesisAgent):
                 raise ValueError(f"Tarea no reconocida: {task.name}")
         
         except Exception as e:
-            self.logger.error(f"Error ejecutando tarea {task.name}: {e}")
+            self.logger.error("Error ejecutando tarea %s: %s", task.name, e)
             return TaskResult(
                 task_id=task.id,
                 success=False,
@@ -166,9 +769,9 @@ class FrontendAgent(GenesisAgent):
             )
 
     # Handlers MCP
-    def _handle_generate_frontend(self, request) -> Dict[str, Any]:
+    async def _handle_generate_frontend(self, request) -> Dict[str, Any]:
         """Handler para generación de frontend"""
-        return self._generate_complete_frontend(request.data)
+        return await self._generate_complete_frontend(request.data)
 
     async def _handle_generate_dockerfile(self, request) -> Dict[str, Any]:
         """Handler para generación de Dockerfile"""
@@ -190,7 +793,75 @@ class FrontendAgent(GenesisAgent):
         """Handler para configuración de routing"""
         return await self._setup_routing(request.data)
 
-    def _generate_complete_frontend(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _render_template(self, template_name: str, template_vars: Mapping[str, Any]) -> bytes:
+        """
+        Renderizar template a bytes UTF-8 listos para escribir
+
+        Con el engine compartido reutiliza el resultado ya codificado de renders
+        previos con las mismas variables. Un engine asignado por el llamador no
+        se memoiza: sus templates o su render pueden cambiar.
+        """
+        engine = self.template_engine
+        if engine is _get_shared_template_engine():
+            frozen_vars = _freeze_template_vars(template_vars)
+            if frozen_vars is not None:
+                return _render_shared_cached(template_name, frozen_vars)
+        return engine.render_template(template_name, dict(template_vars)).encode("utf-8")
+
+    def _run_render(self, func: Callable[..., Dict[Path, bytes]], *args: Any) -> asyncio.Future:
+        """Ejecutar un paso de generación en el pool de render, fuera del event loop"""
+        return asyncio.get_running_loop().run_in_executor(_get_render_pool(), func, *args)
+
+    async def _flush_batch(
+        self, files: Dict[Path, bytes], created_dirs: Optional[Set[Path]] = None
+    ) -> None:
+        """
+        Escribir en disco un lote de archivos generados
+
+        Crea cada directorio padre una sola vez (de menor a mayor profundidad)
+        y luego escribe los archivos fuera del event loop, un thread por
+        directorio. Si se pasa created_dirs, se omiten los directorios ya
+        creados y se registran los nuevos.
+        """
+        by_directory: Dict[Path, List[Tuple[Path, bytes]]] = {}
+        for path, data in files.items():
+            by_directory.setdefault(path.parent, []).append((path, data))
+
+        parents = set(by_directory)
+        if created_dirs is not None:
+            parents -= created_dirs
+            created_dirs.update(parents)
+        for directory in sorted(parents, key=lambda d: len(d.parts)):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        await asyncio.gather(
+            *(asyncio.to_thread(_write_directory_files, entries) for entries in by_directory.values())
+        )
+
+    async def _drain_write_queue(
+        self, queue: asyncio.Queue, created_dirs: Optional[Set[Path]] = None
+    ) -> None:
+        """Escribir en orden los lotes encolados hasta recibir None"""
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                return
+
+            # Agrupar los lotes ya disponibles en una sola escritura
+            pending = dict(batch)
+            done = False
+            while not queue.empty():
+                batch = queue.get_nowait()
+                if batch is None:
+                    done = True
+                    break
+                pending.update(batch)
+
+            await self._flush_batch(pending, created_dirs)
+            if done:
+                return
+
+    async def _generate_complete_frontend(self, params: FrontendParams) -> Dict[str, Any]:
         """
         MÉTODO CORREGIDO: Generate a frontend project for the selected framework.
         
@@ -198,6 +869,8 @@ class FrontendAgent(GenesisAgent):
         - Todas las variables requeridas ahora se pasan correctamente
         - Mejor extracción de configuración del schema
         - Variables por defecto para evitar errores
+        - Los pasos solo generan contenido y corren concurrentemente
+        - La escritura se hace en segundo plano, en el orden de los pasos
         """
         # CORRECCIÓN: Log sin emojis
         self.logger.info("[INIT] Generando frontend completo")
@@ -211,50 +884,77 @@ class FrontendAgent(GenesisAgent):
         project_name = schema.get("project_name") or schema.get("name") or "my-frontend-app"
         description = schema.get("description") or f"Frontend application for {project_name}"
         
-        # Crear estructura de directorios
-        self._create_directory_structure(output_path, config)
-        
-        # Generar archivos principales
-        generated_files = []
-        
-        # 1. Configuración del proyecto
-        config_files = self._generate_project_config(output_path, config, schema, project_name, description)
-        generated_files.extend(config_files)
-        
-        # 2. Aplicación principal
-        app_files = self._generate_main_application(output_path, config, schema, project_name, description)
-        generated_files.extend(app_files)
-        
-        # 3. Dockerfile - CORREGIDO: Generar para todos los frameworks
-        dockerfile = self._generate_dockerfile(output_path, config, project_name, description)
-        if dockerfile:
-            generated_files.append(dockerfile)
-        
+        # Variables comunes a todos los templates, construidas una sola vez
+        base_vars = self._base_template_vars(config, project_name, description)
+
+        # Generar archivos principales: los pasos son independientes y se renderizan
+        # concurrentemente en el pool de render; cada lote {ruta: contenido} se encola para
+        # escritura en el orden original de los pasos
+        steps = [
+            # 1. Configuración del proyecto: un paso por archivo
+            *(
+                self._run_render(generator, *args)
+                for generator, args in self._project_config_steps(output_path, config, schema, base_vars)
+            ),
+            # 2. Aplicación principal
+            self._run_render(self._generate_main_application, output_path, config, schema, base_vars),
+            # 3. Dockerfile - CORREGIDO: Generar para todos los frameworks
+            self._run_render(self._generate_dockerfile, output_path, config, base_vars),
+        ]
+        implemented = self._IMPLEMENTED_GENERATORS
+
         # 4. Componentes base
-        component_files = self._generate_base_components(output_path, config, schema)
-        generated_files.extend(component_files)
-        
+        if "base_components" in implemented:
+            steps.append(self._run_render(self._generate_base_components, output_path, config, schema))
+
         # 5. Configuración de estado
-        if config.state_management != StateManagement.CONTEXT_API:
-            state_files = self._generate_state_management(output_path, config, schema)
-            generated_files.extend(state_files)
-        
+        if "state_management" in implemented and config.state_management != StateManagement.CONTEXT_API:
+            steps.append(self._run_render(self._generate_state_management, output_path, config, schema))
+
         # 6. Configuración de UI
-        ui_files = self._generate_ui_configuration(output_path, config)
-        generated_files.extend(ui_files)
-        
+        if "ui_configuration" in implemented:
+            steps.append(self._run_render(self._generate_ui_configuration, output_path, config))
+
         # 7. Routing
-        routing_files = self._generate_routing_config(output_path, config, schema)
-        generated_files.extend(routing_files)
-        
+        if "routing_config" in implemented:
+            steps.append(self._run_render(self._generate_routing_config, output_path, config, schema))
+
         # 8. Configuración de TypeScript (si está habilitado)
-        if config.typescript:
-            ts_files = self._generate_typescript_config(output_path, config)
-            generated_files.extend(ts_files)
+        if "typescript_config" in implemented and config.typescript:
+            steps.append(self._run_render(self._generate_typescript_config, output_path, config))
 
         # 9. Páginas principales de Next.js
-        pages_files = self._generate_nextjs_pages(config, output_path)
-        generated_files.extend(pages_files)
+        if config.framework == FrontendFramework.NEXTJS:
+            steps.append(self._run_render(self._generate_nextjs_pages, config, output_path))
+
+        batches: List[Dict[Path, bytes]] = []
+        step_tasks = [asyncio.ensure_future(step) for step in steps]
+        write_queue: asyncio.Queue = asyncio.Queue()
+        # Directorios que deja creados _create_directory_structure: el writer
+        # no vuelve a hacer mkdir sobre ellos
+        created_dirs = {output_path, *(output_path / d for d in _DIRECTORY_TREES.get(config.framework, ()))}
+        writer = asyncio.create_task(self._drain_write_queue(write_queue, created_dirs))
+
+        try:
+            # Crear estructura de directorios mientras los pasos renderizan
+            await asyncio.to_thread(self._create_directory_structure, output_path, config)
+
+            for step_task in step_tasks:
+                batch = await step_task
+                if batch:
+                    batches.append(batch)
+                    write_queue.put_nowait(batch)
+
+            # Esperar a que el writer vacíe la cola
+            write_queue.put_nowait(None)
+            await writer
+        finally:
+            for task in (*step_tasks, writer):
+                if not task.done():
+                    task.cancel()
+
+        # Rutas en orden de generación, sin duplicados (page.tsx se reescribe)
+        generated_files = list(dict.fromkeys(map(os.fspath, chain.from_iterable(batches))))
 
         return {
             "framework": config.framework.value,
@@ -262,76 +962,77 @@ class FrontendAgent(GenesisAgent):
             "ui_library": config.ui_library.value,
             "state_management": config.state_management.value,
             "generated_files": generated_files,
-            "output_path": str(output_path),
+            "output_path": os.fspath(output_path),
             "dockerfile_generated": True,
             "next_steps": self._get_next_steps(config),
             "run_commands": self._get_run_commands(config),
         }
 
-    def _generate_dockerfile(self, output_path: Path, config: FrontendConfig, project_name: str, description: str = "Generated frontend") -> Optional[str]:
+    def _generate_dockerfile(self, output_path: Path, config: FrontendConfig, base_vars: Mapping[str, Any]) -> Dict[Path, bytes]:
         """
         MÉTODO CORREGIDO: Generar Dockerfile para el framework específico
         """
+        framework = config.framework
         try:
-            template_map = {
-                FrontendFramework.NEXTJS: "frontend/nextjs/Dockerfile.j2",
-                FrontendFramework.REACT: "frontend/react/Dockerfile.j2",
-                FrontendFramework.VUE: "frontend/vue/Dockerfile.j2",
-            }
-            
-            template_name = template_map.get(config.framework)
+            template_name = _DOCKERFILE_TEMPLATES.get(framework)
             if not template_name:
-                self.logger.warning(f"No hay template de Dockerfile para {config.framework}")
-                return None
+                self.logger.warning("No hay template de Dockerfile para %s", framework)
+                return {}
             
             # CORRECCIÓN: Variables completas para el template incluyendo description
             template_vars = {
-                "project_name": project_name,
-                "description": description,  # CRÍTICO: Variable faltante añadida
-                "framework": config.framework.value,
+                **base_vars,
                 "node_version": "18",
-                "port": 3000 if config.framework == FrontendFramework.NEXTJS else 80,
-                "build_command": self._get_build_command(config.framework),
-                "start_command": self._get_start_command(config.framework),
-                "typescript": config.typescript,
-                "state_management": config.state_management.value,
-                "ui_library": config.ui_library.value,
-                "styling": config.ui_library.value,  # NUEVA: Alias para styling
+                "port": _DOCKERFILE_PORTS.get(framework, 80),
+                "build_command": self._get_build_command(framework),
+                "start_command": self._get_start_command(framework),
                 "version": "1.0.0",  # NUEVA: Variable adicional
                 "entities": [],  # NUEVA: Variable adicional
             }
             
-            content = self.template_engine.render_template(template_name, template_vars)
+            content = self._render_template(template_name, template_vars)
             dockerfile_path = output_path / "Dockerfile"
-            dockerfile_path.write_text(content)
             
             # CORRECCIÓN: Log sin emojis
-            self.logger.info(f"[OK] Dockerfile generado: {dockerfile_path}")
-            return str(dockerfile_path)
+            self.logger.info("[OK] Dockerfile generado: %s", dockerfile_path)
+            return {dockerfile_path: content}
             
         except Exception as e:
-            self.logger.error(f"Error generando Dockerfile: {e}")
-            return None
+            self.logger.error("Error generando Dockerfile: %s", e)
+            return {}
+
+    def _base_template_vars(
+        self, config: FrontendConfig, project_name: str, description: str
+    ) -> Mapping[str, Any]:
+        """
+        Variables comunes a todos los templates del frontend
+
+        Se devuelven como vista de solo lectura: el mismo snapshot se comparte
+        entre los pasos que se renderizan concurrentemente.
+        """
+        values = (
+            project_name,
+            description,
+            config.framework.value,
+            config.typescript,
+            config.state_management.value,
+            config.ui_library.value,
+        )
+        try:
+            return _shared_template_vars(*values)
+        except TypeError:
+            # Valores no hashables: construir sin memoizar
+            return _shared_template_vars.__wrapped__(*values)
 
     def _get_build_command(self, framework: FrontendFramework) -> str:
         """Obtener comando de build según el framework"""
-        commands = {
-            FrontendFramework.NEXTJS: "npm run build",
-            FrontendFramework.REACT: "npm run build",
-            FrontendFramework.VUE: "npm run build",
-        }
-        return commands.get(framework, "npm run build")
+        return _BUILD_COMMANDS.get(framework, "npm run build")
 
     def _get_start_command(self, framework: FrontendFramework) -> str:
         """Obtener comando de start según el framework"""
-        commands = {
-            FrontendFramework.NEXTJS: "npm start",
-            FrontendFramework.REACT: "nginx -g 'daemon off;'",
-            FrontendFramework.VUE: "nginx -g 'daemon off;'",
-        }
-        return commands.get(framework, "npm start")
+        return _START_COMMANDS.get(framework, "npm start")
 
-    async def _generate_frontend_dockerfile(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_frontend_dockerfile(self, params: FrontendParams) -> Dict[str, Any]:
         """
         MÉTODO CORREGIDO: Generar solo el Dockerfile
         """
@@ -339,9 +1040,12 @@ class FrontendAgent(GenesisAgent):
         output_path = Path(params.get("output_path", "./frontend"))
         project_name = params.get("project_name", "frontend-app")
         description = params.get("description", "Frontend application")  # AÑADIDO
-        description = params.get("description", "Frontend application")  # AÑADIDO
         
-        dockerfile = self._generate_dockerfile(output_path, config, project_name, description)
+        # El render de Jinja es CPU-bound: se ejecuta en el pool de render
+        base_vars = self._base_template_vars(config, project_name, description)
+        files = await self._run_render(self._generate_dockerfile, output_path, config, base_vars)
+        await self._flush_batch(files)
+        dockerfile = next((os.fspath(path) for path in files), None)
         
         return {
             "dockerfile_generated": dockerfile is not None,
@@ -349,399 +1053,206 @@ class FrontendAgent(GenesisAgent):
             "framework": config.framework.value
         }
 
-    def _extract_frontend_config(self, params: Dict[str, Any]) -> FrontendConfig:
+    def _extract_frontend_config(self, params: FrontendParams) -> FrontendConfig:
         """
         MÉTODO CORREGIDO: Extraer configuración del frontend con mejores defaults
         """
-        stack = params.get("stack", {})
-        schema = params.get("schema", {})
+        stack = params.get("stack") or {}
+        schema_stack = (params.get("schema") or {}).get("stack") or {}
 
         # CORRECCIÓN: Mejor extracción de valores con defaults robustos
-        framework_val = (
-            params.get("framework") or 
-            stack.get("frontend") or 
-            schema.get("stack", {}).get("frontend") or 
-            "nextjs"
+        framework_val = _first_value(
+            ((params, "framework"), (stack, "frontend"), (schema_stack, "frontend")),
+            "nextjs",
         )
-        
-        state_management_val = (
-            params.get("state_management") or 
-            stack.get("state_management") or 
-            schema.get("stack", {}).get("state_management") or
-            "redux_toolkit"
+
+        state_management_val = _first_value(
+            (
+                (params, "state_management"),
+                (stack, "state_management"),
+                (schema_stack, "state_management"),
+            ),
+            "redux_toolkit",
         )
-        
-        ui_library_val = (
-            params.get("ui_library") or 
-            stack.get("ui_library") or 
-            stack.get("styling") or  # NUEVA: Alias para styling
-            schema.get("stack", {}).get("ui_library") or
-            "tailwindcss"
+
+        ui_library_val = _first_value(
+            (
+                (params, "ui_library"),
+                (stack, "ui_library"),
+                (stack, "styling"),  # NUEVA: Alias para styling
+                (schema_stack, "ui_library"),
+            ),
+            "tailwindcss",
         )
 
         # CORRECCIÓN: TypeScript por defecto para Next.js
         typescript_default = framework_val == "nextjs"
         typescript_val = params.get("typescript", typescript_default)
 
-        return FrontendConfig(
-            framework=FrontendFramework(framework_val),
-            state_management=StateManagement(state_management_val),
-            ui_library=UILibrary(ui_library_val),
-            typescript=typescript_val,
-            testing_framework=params.get("testing_framework", "jest"),
-            pwa_enabled=params.get("pwa_enabled", False),
-            ssr_enabled=params.get("ssr_enabled", True),
-            features=params.get("features", []),
-            custom_components=params.get("custom_components", []),
-            api_base_url=params.get("api_base_url", "http://localhost:8000"),
-            environment_vars=params.get("env_vars", {})
+        config_args = (
+            framework_val,
+            state_management_val,
+            ui_library_val,
+            typescript_val,
+            params.get("testing_framework", "jest"),
+            params.get("pwa_enabled", False),
+            params.get("ssr_enabled", True),
+            params.get("features", []),
+            params.get("custom_components", []),
+            params.get("api_base_url", "http://localhost:8000"),
+            params.get("env_vars", {}),
         )
 
+        # Reutilizar la configuración si los parámetros se repiten
+        try:
+            key = config_args[:7] + (
+                tuple(config_args[7]),
+                tuple(config_args[8]),
+                config_args[9],
+                frozenset(config_args[10].items()),
+            )
+            hash(key)
+        except (TypeError, AttributeError):
+            return _build_frontend_config(*config_args)
+        # Cada llamada recibe su propia copia: la instancia memoizada nunca se expone
+        return _copy_frontend_config(_cached_frontend_config(key))
+
     def _create_directory_structure(self, base_path: Path, config: FrontendConfig):
         """Crear estructura de directorios"""
-        if config.framework == FrontendFramework.NEXTJS:
-            directories = [
-                "app",
-                "components/ui",
-                "components/layout", 
-                "components/features",
-                "lib",
-                "hooks",
-                "types",
-                "store",
-                "styles",
-                "public",
-                "tests"
-            ]
-        elif config.framework == FrontendFramework.REACT:
-            directories = [
-                "src/components/ui",
-                "src/components/layout",
-                "src/components/features",
-                "src/hooks",
-                "src/types",
-                "src/store",
-                "src/services",
-                "src/utils",
-                "src/styles",
-                "public",
-                "tests"
-            ]
-        elif config.framework == FrontendFramework.VUE:
-            directories = [
-                "src/components",
-                "src/views",
-                "src/router",
-                "src/store",
-                "src/composables",
-                "src/types",
-                "src/services",
-                "src/assets",
-                "public",
-                "tests"
-            ]
-        
-        for directory in directories:
-            (base_path / directory).mkdir(parents=True, exist_ok=True)
+        base = os.fspath(base_path)
+        for directory in _DIRECTORY_LAYOUTS.get(config.framework, ()):
+            os.makedirs(os.path.join(base, directory), exist_ok=True)
 
     def _generate_project_config(
         self, 
         output_path: Path, 
         config: FrontendConfig,
         schema: Dict[str, Any],
-        project_name: str,
-        description: str
-    ) -> List[str]:
+        base_vars: Mapping[str, Any]
+    ) -> Dict[Path, bytes]:
         """
         MÉTODO CORREGIDO: Generar archivos de configuración del proyecto
         """
-        generated_files = []
-        
-        if config.framework in [FrontendFramework.NEXTJS, FrontendFramework.REACT]:
-            # package.json
-            package_file = self._generate_package_json(output_path, config, schema, project_name, description)
-            generated_files.append(package_file)
-            
-            # tsconfig.json (si TypeScript está habilitado)
-            if config.typescript:
-                tsconfig_file = self._generate_tsconfig(output_path, config)
-                generated_files.append(tsconfig_file)
-            
-            # next.config.js (solo para Next.js) - CORREGIDO: Con todas las variables
-            if config.framework == FrontendFramework.NEXTJS:
-                nextconfig_file = self._generate_next_config(output_path, config, schema, project_name, description)
-                generated_files.append(nextconfig_file)
-        
-        elif config.framework == FrontendFramework.VUE:
-            # package.json para Vue
-            package_file = self._generate_vue_package_json(output_path, config, schema, project_name, description)
-            generated_files.append(package_file)
-            
-            # vite.config.ts
-            vite_config = self._generate_vite_config(output_path, config)
-            generated_files.append(vite_config)
-        
-        return generated_files
+        files: Dict[Path, bytes] = {}
+        for generator, args in self._project_config_steps(output_path, config, schema, base_vars):
+            files.update(generator(*args))
+        return files
+
+    def _project_config_steps(
+        self,
+        output_path: Path,
+        config: FrontendConfig,
+        schema: Dict[str, Any],
+        base_vars: Mapping[str, Any]
+    ) -> List[Tuple[Callable[..., Dict[Path, bytes]], Tuple[Any, ...]]]:
+        """
+        Generadores independientes de la configuración del proyecto
+
+        Devuelve pares (generador, argumentos) en orden de escritura para que
+        cada archivo pueda renderizarse por separado en el pool de render.
+        """
+        framework = config.framework
+        if framework == FrontendFramework.VUE:
+            # package.json y vite.config.ts para Vue
+            return [
+                (self._generate_vue_package_json, (output_path, config, schema, base_vars)),
+                (self._generate_vite_config, (output_path, config)),
+            ]
+        if framework not in (FrontendFramework.NEXTJS, FrontendFramework.REACT):
+            return []
+
+        # package.json y tsconfig.json (si TypeScript está habilitado)
+        steps: List[Tuple[Callable[..., Dict[Path, bytes]], Tuple[Any, ...]]] = [
+            (self._generate_package_json, (output_path, config, schema, base_vars)),
+        ]
+        if config.typescript:
+            steps.append((self._generate_tsconfig, (output_path, config)))
+        if framework == FrontendFramework.NEXTJS:
+            # next.config.js - CORREGIDO: Con todas las variables
+            steps.append((self._generate_next_config, (output_path, config, schema, base_vars)))
+        return steps
 
     def _generate_package_json(
         self,
         output_path: Path,
         config: FrontendConfig,
         schema: Dict[str, Any],
-        project_name: str,
-        description: str
-    ) -> str:
+        base_vars: Mapping[str, Any]
+    ) -> Dict[Path, bytes]:
         """
         MÉTODO CORREGIDO: Generar package.json con todas las variables
         """
         # CORRECCIÓN: Variables completas para el template
         template_vars = {
-            "project_name": project_name,
-            "description": description,
-            "framework": config.framework.value,
-            "typescript": config.typescript,
-            "ui_library": config.ui_library.value,
-            "state_management": config.state_management.value,
+            **base_vars,
             "testing_framework": config.testing_framework,
             "pwa_enabled": config.pwa_enabled,
-            "styling": config.ui_library.value,  # NUEVA: Alias para styling
             "ui_components": schema.get("stack", {}).get("ui_components", ""),
         }
         
-        if config.framework == FrontendFramework.NEXTJS:
-            template_name = "frontend/nextjs/package.json.j2"
-        else:
-            template_name = "frontend/react/package.json.j2"
-        
-        content = self.template_engine.render_template(template_name, template_vars)
+        template_name = _PACKAGE_JSON_TEMPLATES[config.framework]
+        content = self._render_template(template_name, template_vars)
         
         output_file = output_path / "package.json"
-        output_file.write_text(content)
-        
-        return str(output_file)
+        return {output_file: content}
 
     def _generate_main_application(
         self, 
         output_path: Path, 
         config: FrontendConfig, 
         schema: Dict[str, Any],
-        project_name: str,
-        description: str
-    ) -> List[str]:
+        base_vars: Mapping[str, Any]
+    ) -> Dict[Path, bytes]:
         """
         MÉTODO CORREGIDO: Generar aplicación principal con todas las variables
         """
-        generated_files = []
-
-        # CORRECCIÓN: Variables template completas
-        template_vars = {
-            "project_name": project_name,
-            "description": description,
-            "typescript": config.typescript,
-            "state_management": config.state_management.value,
-            "ui_library": config.ui_library.value,
-            "styling": config.ui_library.value,  # NUEVA: Alias
-            "framework": config.framework.value,
-        }
+        files: Dict[Path, bytes] = {}
 
-        if config.framework == FrontendFramework.NEXTJS:
-            # app/layout.tsx
-            layout_file = output_path / "app/layout.tsx"
-            layout_file.parent.mkdir(parents=True, exist_ok=True)
+        # Archivos principales del framework: (ruta relativa, template)
+        for relative_path, template_name in _MAIN_APP_TEMPLATES.get(config.framework, ()):
+            files[output_path / relative_path] = self._render_template(template_name, base_vars)
 
-            layout_content = self.template_engine.render_template(
-                "frontend/nextjs/app/layout.tsx.j2",
-                template_vars
-            )
-            layout_file.write_text(layout_content)
-            generated_files.append(str(layout_file))
-
-            # app/page.tsx (se genera posteriormente en _generate_main_page)
-            page_file = output_path / "app/page.tsx"
-            page_content = self.template_engine.render_template(
-                "frontend/nextjs/app/page.tsx.j2",
-                template_vars
-            )
-            page_file.write_text(page_content)
-            generated_files.append(str(page_file))
-
-        elif config.framework == FrontendFramework.REACT:
-            # index.html
-            index_file = output_path / "index.html"
-            index_content = self.template_engine.render_template(
-                "frontend/react/index.html.j2",
-                template_vars
-            )
-            index_file.write_text(index_content)
-            generated_files.append(str(index_file))
-
-            # src/App.tsx
-            app_file = output_path / "src/App.tsx"
-            app_file.parent.mkdir(parents=True, exist_ok=True)
-            app_content = self.template_engine.render_template(
-                "frontend/react/src/App.tsx.j2",
-                template_vars
-            )
-            app_file.write_text(app_content)
-            generated_files.append(str(app_file))
-
-            # src/main.tsx
-            main_file = output_path / "src/main.tsx"
-            main_content = self.template_engine.render_template(
-                "frontend/react/src/main.tsx.j2",
-                template_vars
-            )
-            main_file.write_text(main_content)
-            generated_files.append(str(main_file))
-
-        return generated_files
+        return files
 
     # Métodos auxiliares mejorados
-    def _generate_base_components(self, output_path: Path, config: FrontendConfig, schema: Dict[str, Any]) -> List[str]:
+    def _generate_base_components(self, output_path: Path, config: FrontendConfig, schema: Dict[str, Any]) -> Dict[Path, bytes]:
         """Generar componentes base"""
-        generated_files = []
-        
-        if config.framework == FrontendFramework.NEXTJS:
-            # Generar componente Header básico
-            header_file = output_path / "components/layout/Header.tsx"
-            header_file.parent.mkdir(parents=True, exist_ok=True)
-            header_content = """export default function Header() {
-  return (
-    <header className="bg-white shadow">
-      <div className="max-w-7xl mx-auto py-6 px-4">
-        <h1 className="text-3xl font-bold text-gray-900">
-          Frontend App
-        </h1>
-      </div>
-    </header>
-  );
-}"""
-            header_file.write_text(header_content)
-            generated_files.append(str(header_file))
-        
-        return generated_files
+        return {
+            output_path / relative_path: content
+            for relative_path, content in _BASE_COMPONENT_FILES.get(config.framework, ())
+        }
 
-    def _generate_state_management(self, output_path: Path, config: FrontendConfig, schema: Dict[str, Any]) -> List[str]:
+    def _generate_state_management(self, output_path: Path, config: FrontendConfig, schema: Dict[str, Any]) -> Dict[Path, bytes]:
         """Generar configuración de gestión de estado"""
-        generated_files = []
-        
-        if config.state_management == StateManagement.REDUX_TOOLKIT and config.framework == FrontendFramework.NEXTJS:
-            # store/index.ts
-            store_file = output_path / "store/index.ts"
-            store_file.parent.mkdir(parents=True, exist_ok=True)
-            store_content = """import { configureStore } from '@reduxjs/toolkit';
-
-export const store = configureStore({
-  reducer: {
-    // Add reducers here
-  },
-});
-
-export type RootState = ReturnType<typeof store.getState>;
-export type AppDispatch = typeof store.dispatch;"""
-            store_file.write_text(store_content)
-            generated_files.append(str(store_file))
-        
-        return generated_files
+        key = (config.framework, config.state_management)
+        return {
+            output_path / relative_path: content
+            for relative_path, content in _STATE_MANAGEMENT_FILES.get(key, ())
+        }
 
-    def _generate_ui_configuration(self, output_path: Path, config: FrontendConfig) -> List[str]:
+    def _generate_ui_configuration(self, output_path: Path, config: FrontendConfig) -> Dict[Path, bytes]:
         """Generar configuración de UI"""
-        generated_files = []
-        
-        if config.ui_library == UILibrary.TAILWINDCSS:
-            # tailwind.config.js
-            tailwind_file = output_path / "tailwind.config.js"
-            tailwind_content = """module.exports = {
-  content: [
-    './app/**/*.{js,ts,jsx,tsx}',
-    './components/**/*.{js,ts,jsx,tsx}',
-  ],
-  theme: {
-    extend: {},
-  },
-  plugins: [],
-};"""
-            tailwind_file.write_text(tailwind_content)
-            generated_files.append(str(tailwind_file))
-            
-            # globals.css
-            css_file = output_path / "styles/globals.css"
-            css_file.parent.mkdir(parents=True, exist_ok=True)
-            css_content = """@tailwind base;
-@tailwind components;
-@tailwind utilities;"""
-            css_file.write_text(css_content)
-            generated_files.append(str(css_file))
-        
-        return generated_files
+        return {
+            output_path / relative_path: content
+            for relative_path, content in _UI_LIBRARY_FILES.get(config.ui_library, ())
+        }
 
-    def _generate_routing_config(self, output_path: Path, config: FrontendConfig, schema: Dict[str, Any]) -> List[str]:
+    def _generate_routing_config(self, output_path: Path, config: FrontendConfig, schema: Dict[str, Any]) -> Dict[Path, bytes]:
         """Generar configuración de routing"""
-        return []  # Next.js usa file-based routing
+        return {}  # Next.js usa file-based routing
 
-    def _generate_typescript_config(self, output_path: Path, config: FrontendConfig) -> List[str]:
+    def _generate_typescript_config(self, output_path: Path, config: FrontendConfig) -> Dict[Path, bytes]:
         """Generar configuración de TypeScript"""
-        return []  # tsconfig.json ya se genera en _generate_tsconfig
+        return {}  # tsconfig.json ya se genera en _generate_tsconfig
 
     def _get_next_steps(self, config: FrontendConfig) -> List[str]:
         """Obtener siguientes pasos"""
-        steps = [
-            "1. Instalar dependencias: npm install",
-            "2. Configurar variables de entorno en .env.local",
-        ]
-        
-        if config.framework == FrontendFramework.NEXTJS:
-            steps.extend([
-                "3. Iniciar servidor de desarrollo: npm run dev",
-                "4. Acceder a: http://localhost:3000"
-            ])
-        elif config.framework == FrontendFramework.REACT:
-            steps.extend([
-                "3. Iniciar servidor de desarrollo: npm start",
-                "4. Acceder a: http://localhost:3000"
-            ])
-        elif config.framework == FrontendFramework.VUE:
-            steps.extend([
-                "3. Iniciar servidor de desarrollo: npm run dev",
-                "4. Acceder a: http://localhost:5173"
-            ])
-        
-        return steps
+        return list(_NEXT_STEPS.get(config.framework, _BASE_NEXT_STEPS))
 
     def _get_run_commands(self, config: FrontendConfig) -> Dict[str, str]:
         """Obtener comandos de ejecución"""
-        if config.framework == FrontendFramework.NEXTJS:
-            return {
-                "install": "npm install",
-                "dev": "npm run dev",
-                "build": "npm run build",
-                "start": "npm start",
-                "test": "npm test",
-                "lint": "npm run lint",
-                "docker_build": "docker build -t frontend .",
-                "docker_run": "docker run -p 3000:3000 frontend"
-            }
-        elif config.framework == FrontendFramework.REACT:
-            return {
-                "install": "npm install", 
-                "start": "npm start",
-                "build": "npm run build",
-                "test": "npm test",
-                "docker_build": "docker build -t frontend .",
-                "docker_run": "docker run -p 80:80 frontend"
-            }
-        elif config.framework == FrontendFramework.VUE:
-            return {
-                "install": "npm install",
-                "dev": "npm run dev",
-                "build": "npm run build",
-                "preview": "npm run preview",
-                "test": "npm run test",
-                "docker_build": "docker build -t frontend .",
-                "docker_run": "docker run -p 80:80 frontend"
-            }
-        
-        return {}
+        # Copia mutable: el resultado se serializa y puede modificarse aguas abajo
+        return dict(_RUN_COMMANDS.get(config.framework, _EMPTY_RUN_COMMANDS))
 
     # Métodos auxiliares async - implementación mejorada
     async def _generate_components(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -761,80 +1272,24 @@ export type AppDispatch = typeof store.dispatch;"""
         return {"status": "routing_configured"}
 
     # Métodos de configuración específicos corregidos
-    def _generate_tsconfig(self, output_path: Path, config: FrontendConfig) -> str:
+    def _generate_tsconfig(self, output_path: Path, config: FrontendConfig) -> Dict[Path, bytes]:
         """MÉTODO CORREGIDO: Generar tsconfig.json"""
         output_file = output_path / "tsconfig.json"
         
-        if config.framework == FrontendFramework.NEXTJS:
-            content = """{
-  "compilerOptions": {
-    "target": "es5",
-    "lib": ["dom", "dom.iterable", "es6"],
-    "allowJs": true,
-    "skipLibCheck": true,
-    "strict": true,
-    "forceConsistentCasingInFileNames": true,
-    "noEmit": true,
-    "esModuleInterop": true,
-    "module": "esnext",
-    "moduleResolution": "node",
-    "resolveJsonModule": true,
-    "isolatedModules": true,
-    "jsx": "preserve",
-    "incremental": true,
-    "plugins": [
-      {
-        "name": "next"
-      }
-    ],
-    "paths": {
-      "@/*": ["./*"]
-    }
-  },
-  "include": ["next-env.d.ts", "**/*.ts", "**/*.tsx", ".next/types/**/*.ts"],
-  "exclude": ["node_modules"]
-}"""
-        else:
-            content = """{
-  "compilerOptions": {
-    "target": "ES2020",
-    "useDefineForClassFields": true,
-    "lib": ["ES2020", "DOM", "DOM.Iterable"],
-    "module": "ESNext",
-    "skipLibCheck": true,
-    "moduleResolution": "bundler",
-    "allowImportingTsExtensions": true,
-    "resolveJsonModule": true,
-    "isolatedModules": true,
-    "noEmit": true,
-    "jsx": "react-jsx",
-    "strict": true,
-    "noUnusedLocals": true,
-    "noUnusedParameters": true,
-    "noFallthroughCasesInSwitch": true
-  },
-  "include": ["src"],
-  "references": [{ "path": "./tsconfig.node.json" }]
-}"""
-        
-        output_file.write_text(content)
-        return str(output_file)
+        return {output_file: _TSCONFIGS.get(config.framework, _VITE_TSCONFIG)}
 
-    def _generate_nextjs_pages(self, config: FrontendConfig, output_path: Path) -> List[str]:
+    def _generate_nextjs_pages(self, config: FrontendConfig, output_path: Path) -> Dict[Path, bytes]:
         """Generar páginas de Next.js"""
-        generated_files: List[str] = []
+        files: Dict[Path, bytes] = {}
 
         if config.framework == FrontendFramework.NEXTJS:
-            main_page = self._generate_main_page(config, output_path)
-            if main_page:
-                generated_files.append(main_page)
+            files.update(self._generate_main_page(config, output_path))
 
-        return generated_files
+        return files
 
-    def _generate_main_page(self, config: FrontendConfig, output_path: Path) -> str:
+    def _generate_main_page(self, config: FrontendConfig, output_path: Path) -> Dict[Path, bytes]:
         """Generar página principal funcional (page.tsx)"""
         app_dir = output_path / "app"
-        app_dir.mkdir(parents=True, exist_ok=True)
 
         project_name = getattr(config, "project_name", "Genesis App")
 
@@ -984,106 +1439,53 @@ export default function HomePage() {{
 """
 
         page_file = app_dir / "page.tsx"
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-
-        self.logger.info(f"✅ Página principal generada: {page_file}")
-        return str(page_file)
+        self.logger.info("✅ Página principal generada: %s", page_file)
+        return {page_file: page_content.encode("utf-8")}
 
     def _generate_next_config(
         self, 
         output_path: Path, 
         config: FrontendConfig, 
         schema: Dict[str, Any],
-        project_name: str,
-        description: str
-    ) -> str:
+        base_vars: Mapping[str, Any]
+    ) -> Dict[Path, bytes]:
         """
         MÉTODO CORREGIDO: Generar next.config.js con todas las variables
         """
         output_file = output_path / "next.config.js"
         
-        # CORRECCIÓN: Variables completas para evitar errores de template
-        template_vars = {
-            "project_name": project_name,
-            "description": description,
-            "typescript": config.typescript,
-            "state_management": config.state_management.value,
-            "ui_library": config.ui_library.value,
-            "styling": config.ui_library.value,  # NUEVA: Alias
-            "framework": config.framework.value,
-        }
-        
         try:
-            content = self.template_engine.render_template("frontend/nextjs/next.config.js.j2", template_vars)
-        except Exception as e:
+            content = self._render_template(_NEXT_CONFIG_TEMPLATE, base_vars)
+        except _TEMPLATE_ERRORS as e:
             # Fallback content si el template falla
-            self.logger.warning(f"Template fallback para next.config.js: {e}")
-            content = """/** @type {import('next').NextConfig} */
-const nextConfig = {
-  experimental: {
-    appDir: true,
-  },
-}
-
-module.exports = nextConfig"""
+            self.logger.warning("Template fallback para next.config.js: %s", e)
+            content = _NEXT_CONFIG_FALLBACK
         
-        output_file.write_text(content)
-        return str(output_file)
+        return {output_file: content}
 
     def _generate_vue_package_json(
         self, 
         output_path: Path, 
         config: FrontendConfig, 
         schema: Dict[str, Any],
-        project_name: str,
-        description: str
-    ) -> str:
+        base_vars: Mapping[str, Any]
+    ) -> Dict[Path, bytes]:
         """MÉTODO CORREGIDO: Generar package.json para Vue"""
-        template_vars = {
-            "project_name": project_name,
-            "description": description,
-            "framework": config.framework.value,
-        }
-        
+        project_name = base_vars["project_name"]
+
         try:
-            content = self.template_engine.render_template("frontend/vue/package.json.j2", template_vars)
-        except Exception as e:
+            content = self._render_template(
+                _PACKAGE_JSON_TEMPLATES[FrontendFramework.VUE], base_vars
+            )
+        except _TEMPLATE_ERRORS as e:
             # Fallback content
-            self.logger.warning(f"Template fallback para Vue package.json: {e}")
-            content = f"""{{
-  "name": "{project_name}",
-  "private": true,
-  "version": "0.0.0",
-  "type": "module",
-  "scripts": {{
-    "dev": "vite",
-    "build": "vue-tsc && vite build",
-    "preview": "vite preview"
-  }},
-  "dependencies": {{
-    "vue": "^3.3.4"
-  }},
-  "devDependencies": {{
-    "@vitejs/plugin-vue": "^4.2.3",
-    "typescript": "^5.0.2",
-    "vite": "^4.4.5",
-    "vue-tsc": "^1.8.5"
-  }}
-}}"""
+            self.logger.warning("Template fallback para Vue package.json: %s", e)
+            content = (_VUE_PACKAGE_JSON_FALLBACK % (project_name,)).encode("utf-8")
         
         output_file = output_path / "package.json"
-        output_file.write_text(content)
-        return str(output_file)
+        return {output_file: content}
 
-    def _generate_vite_config(self, output_path: Path, config: FrontendConfig) -> str:
+    def _generate_vite_config(self, output_path: Path, config: FrontendConfig) -> Dict[Path, bytes]:
         """Generar vite.config.ts"""
         output_file = output_path / "vite.config.ts"
-        content = """import { defineConfig } from 'vite'
-import vue from '@vitejs/plugin-vue'
-
-export default defineConfig({
-  plugins: [vue()],
-})"""
-        output_file.write_text(content)
-        return str(output_file)
\ No newline at end of file
+        return {output_file: _VUE_VITE_CONFIG}
\ No newline at end of file
@@ -14,11 +14,21 @@ Este agente es responsable de:
 """
 
 import ast
+import asyncio
+from collections import Counter, OrderedDict, defaultdict
+import hashlib
+import os
 import re
+import sys
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from types import MappingProxyType
+from functools import lru_cache
+from itertools import chain
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
 import logging
 import ast
@@ -27,6 +37,19 @@ import io
 from typing import Generator, Tuple
 
 from genesis_engine.mcp.agent_base import GenesisAgent, AgentTask, TaskResult
+from genesis_engine.utils.files import write_bytes
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from tree_sitter_languages import get_language, get_parser
+    HAS_TREE_SITTER = True
+except ImportError:
+    HAS_TREE_SITTER = False
 
 class OptimizationType(str, Enum):
     """Tipos de optimización"""
@@ -45,7 +68,10 @@ class SeverityLevel(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-@dataclass
+# dataclass(slots=True) solo existe desde Python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class PerformanceIssue:
     """Issue de rendimiento detectado"""
     type: OptimizationType
@@ -57,7 +83,7 @@ class PerformanceIssue:
     code_snippet: Optional[str] = None
     estimated_impact: str = "medium"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OptimizationResult:
     """Resultado de optimización"""
     applied_optimizations: List[str]
@@ -67,6 +93,490 @@ class OptimizationResult:
     files_modified: List[str]
     recommendations: List[str]
 
+# Extensiones analizadas como JS/TS y directorios que no se recorren
+_JS_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx')
+_IGNORED_DIRECTORIES = frozenset({'node_modules', '.git', '__pycache__', 'venv', '.venv'})
+
+# Caché de análisis por archivo (se invalida al cambiar las reglas o al
+# activar tree-sitter, que cambia los resultados de useEffect)
+_ANALYSIS_CACHE_FILE = Path(".genesis") / "analysis_cache.json"
+_ANALYSIS_CACHE_VERSION = "3-tree-sitter" if HAS_TREE_SITTER else "3"
+
+# Puntos que resta cada issue según su severidad
+_PERFORMANCE_PENALTIES = {
+    SeverityLevel.CRITICAL: 2.0,
+    SeverityLevel.HIGH: 1.0,
+    SeverityLevel.MEDIUM: 0.5,
+    SeverityLevel.LOW: 0.2
+}
+_SECURITY_PENALTIES = {
+    SeverityLevel.CRITICAL: 3.0,
+    SeverityLevel.HIGH: 2.0,
+    SeverityLevel.MEDIUM: 1.0,
+    SeverityLevel.LOW: 0.5
+}
+
+# Indicador visual por severidad en el reporte de optimización
+_SEVERITY_EMOJI = {
+    SeverityLevel.CRITICAL: "🔴",
+    SeverityLevel.HIGH: "🟠",
+    SeverityLevel.MEDIUM: "🟡",
+    SeverityLevel.LOW: "🟢"
+}
+
+# Análisis de archivos recordados por sesión del agente
+_SESSION_ANALYSES_SIZE = 1000
+
+# A partir de cuántos archivos el análisis se reparte en un pool de procesos
+_PROCESS_POOL_MIN_FILES = 16
+
+# Query de tree-sitter: llamadas a useEffect y sus argumentos
+_USE_EFFECT_QUERY = """
+(call_expression
+  function: (identifier) @function
+  arguments: (arguments) @arguments
+  (#eq? @function "useEffect"))
+"""
+
+# Palabras clave de reglas sobre el AST de Python
+_ORM_ATTRIBUTE_KEYWORDS = ('query', 'filter', 'get')
+# Descripción fija por llamada peligrosa: todos los issues comparten el mismo string
+_DANGEROUS_CALLS = {
+    'eval': "Uso de eval() - riesgo de seguridad",
+    'exec': "Uso de exec() - riesgo de seguridad",
+}
+_FORMAT_CALL = b'.format('
+
+# Nodos que suman complejidad ciclomática y nodos que abren un nivel de anidación
+_BRANCH_NODES = (ast.If, ast.While, ast.For)
+_SCOPE_NODES = frozenset({ast.FunctionDef, ast.ClassDef})
+
+# Expresiones regulares aplicadas línea a línea, compiladas una sola vez
+_RE_DOM_QUERY_IN_LOOP = re.compile(r'for.*document\.querySelector|while.*document\.querySelector')
+_RE_IMG_SRC = re.compile(r'<img.*src=.*\.(?:jpg|jpeg|png)')
+_RE_LAZY = re.compile(r'lazy', re.IGNORECASE)
+# Palabras clave SQL en cualquier posición y sin distinguir mayúsculas,
+# en una sola pasada y sin copiar el string con upper()
+_RE_SQL_KEYWORD = re.compile(r'SELECT|INSERT|UPDATE|DELETE', re.IGNORECASE)
+# Prefiltro sobre los bytes del archivo: alguna regla de Python podría aplicarse
+_RE_PYTHON_RULE_TRIGGERS = re.compile(rb'for|while|eval|exec|SELECT|INSERT|UPDATE|DELETE', re.IGNORECASE)
+_RE_HARDCODED_SECRET = re.compile(r"(?i)(?:password|secret|token)\s*=\s*['\"]")
+_RE_SELECT_STAR = re.compile(r"SELECT\s+\*", re.IGNORECASE)
+_RE_OBJECTS_ALL = re.compile(r"\.objects\.all\(\)")
+
+def _line_starts(data: bytes) -> List[int]:
+    """Offsets de inicio de cada línea de data"""
+    starts = [0]
+    find = data.find
+    index = find(b'\n')
+    while index != -1:
+        starts.append(index + 1)
+        index = find(b'\n', index + 1)
+    return starts
+
+def _find_offsets(data: bytes, needle: bytes) -> List[int]:
+    """Offsets (ordenados) de todas las apariciones de needle en data"""
+    offsets = []
+    find = data.find
+    index = find(needle)
+    while index != -1:
+        offsets.append(index)
+        index = find(needle, index + 1)
+    return offsets
+
+class _PythonRuleVisitor(ast.NodeVisitor):
+    """
+    Visitor que aplica todas las reglas de Python en un único recorrido
+    
+    En lugar de volver a recorrer el cuerpo de cada bucle, mantiene el
+    contexto (bucles abiertos, primera sentencia de un for) mientras baja
+    por el árbol.
+    """
+    
+    def __init__(self, file_path: str, data: bytes):
+        self.file_path = file_path
+        # Código fuente sin decodificar: solo se decodifican las líneas reportadas
+        self.data = data
+        # Inicio de cada línea; se calcula solo si se emite algún issue
+        self.line_starts: Optional[List[int]] = None
+        self.issues: List[PerformanceIssue] = []
+        self.for_stack: List[ast.For] = []
+        self.loop_depth = 0
+        # > 0 dentro de la primera sentencia del cuerpo de un for (N+1)
+        self.orm_scope = 0
+        # Posiciones de '.format(' en data; se calculan solo si hacen falta
+        self.format_offsets: Optional[List[int]] = None
+        # Líneas ya reportadas como N+1 (un issue por línea)
+        self.orm_lines: Set[int] = set()
+    
+    def _add_issue(
+        self,
+        issue_type: OptimizationType,
+        severity: SeverityLevel,
+        line_number: int,
+        description: str,
+        recommendation: str
+    ) -> None:
+        self.issues.append(PerformanceIssue(
+            type=issue_type,
+            severity=severity,
+            file_path=self.file_path,
+            line_number=line_number,
+            description=description,
+            recommendation=recommendation,
+            code_snippet=self._line(line_number)
+        ))
+    
+    def _line(self, line_number: int) -> str:
+        """Texto de la línea indicada (1-based), sin dividir todo el archivo"""
+        line_starts = self.line_starts
+        if line_starts is None:
+            line_starts = self.line_starts = _line_starts(self.data)
+        if line_number > len(line_starts):
+            return ""
+        data = self.data
+        start = line_starts[line_number-1]
+        end = data.find(b'\n', start)
+        line = data[start:] if end == -1 else data[start:end]
+        return line.decode('utf-8', errors='replace')
+    
+    def visit_For(self, node: ast.For):
+        self.for_stack.append(node)
+        self.loop_depth += 1
+        self.visit(node.target)
+        self.visit(node.iter)
+        if node.body:
+            self.orm_scope += 1
+            self.visit(node.body[0])
+            self.orm_scope -= 1
+            for stmt in node.body[1:]:
+                self.visit(stmt)
+        for stmt in node.orelse:
+            self.visit(stmt)
+        self.loop_depth -= 1
+        self.for_stack.pop()
+    
+    def visit_While(self, node: ast.While):
+        self.loop_depth += 1
+        self.generic_visit(node)
+        self.loop_depth -= 1
+    
+    def visit_Call(self, node: ast.Call):
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+            # Detectar llamadas a len() en cada iteración
+            if name == 'len' and self.for_stack:
+                self._add_issue(
+                    OptimizationType.PERFORMANCE,
+                    SeverityLevel.MEDIUM,
+                    self.for_stack[-1].lineno,
+                    "Llamada a len() dentro de bucle",
+                    "Calcular len() una vez antes del bucle"
+                )
+            # Detectar eval() y exec()
+            elif name in _DANGEROUS_CALLS:
+                self._add_issue(
+                    OptimizationType.SECURITY,
+                    SeverityLevel.CRITICAL,
+                    node.lineno,
+                    _DANGEROUS_CALLS[name],
+                    "Evitar eval() y exec(), usar alternativas más seguras"
+                )
+        self.generic_visit(node)
+    
+    def visit_AugAssign(self, node: ast.AugAssign):
+        # Detectar concatenación de strings en bucles
+        if self.loop_depth and isinstance(node.op, ast.Add) and isinstance(node.target, ast.Name):
+            self._add_issue(
+                OptimizationType.PERFORMANCE,
+                SeverityLevel.MEDIUM,
+                node.lineno,
+                "Concatenación de strings en bucle",
+                "Usar join() o lista + join() para mejor rendimiento"
+            )
+        self.generic_visit(node)
+    
+    def visit_Attribute(self, node: ast.Attribute):
+        # Detectar consultas N+1 (patrón común en ORMs)
+        if self.orm_scope and isinstance(node.value, ast.Name) and node.lineno not in self.orm_lines:
+            attr = node.attr.lower()
+            if any(keyword in attr for keyword in _ORM_ATTRIBUTE_KEYWORDS):
+                self.orm_lines.add(node.lineno)
+                self._add_issue(
+                    OptimizationType.DATABASE,
+                    SeverityLevel.HIGH,
+                    node.lineno,
+                    "Posible problema N+1 en consultas de base de datos",
+                    "Usar prefetch_related() o select_related() para optimizar consultas"
+                )
+        self.generic_visit(node)
+    
+    def _has_format_call(self, start: int, end: int) -> bool:
+        """Si hay un '.format(' completo dentro de data[start:end], sin copiar la ventana"""
+        offsets = self.format_offsets
+        if offsets is None:
+            offsets = self.format_offsets = _find_offsets(self.data, _FORMAT_CALL)
+        index = bisect_left(offsets, start)
+        return index < len(offsets) and offsets[index] + len(_FORMAT_CALL) <= end
+    
+    def visit_Name(self, node: ast.Name):
+        # Hoja para todas las reglas: no bajar a su contexto (Load/Store)
+        pass
+    
+    def visit_Constant(self, node: ast.Constant):
+        # Detectar SQL queries no parametrizadas
+        value = node.value
+        if isinstance(value, str) and _RE_SQL_KEYWORD.search(value):
+            if '%' in value or self._has_format_call(max(0, node.col_offset-50), node.col_offset+50):
+                self._add_issue(
+                    OptimizationType.SECURITY,
+                    SeverityLevel.HIGH,
+                    node.lineno,
+                    "Posible SQL injection - query no parametrizada",
+                    "Usar queries parametrizadas o ORMs seguros"
+                )
+    
+    # Handler por tipo exacto de nodo: una búsqueda en dict en lugar de
+    # construir el nombre "visit_<Clase>" y resolverlo con getattr
+    _HANDLERS = {
+        ast.For: visit_For,
+        ast.While: visit_While,
+        ast.Call: visit_Call,
+        ast.AugAssign: visit_AugAssign,
+        ast.Attribute: visit_Attribute,
+        ast.Name: visit_Name,
+        ast.Constant: visit_Constant,
+    }
+    
+    def visit(self, node: ast.AST):
+        handler = self._HANDLERS.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(self, node)
+    
+    def generic_visit(self, node: ast.AST):
+        visit = self.visit
+        for child in ast.iter_child_nodes(node):
+            visit(child)
+
+def _complexity_metrics(tree: ast.AST) -> Dict[str, int]:
+    """
+    Complejidad ciclomática, funciones, clases y profundidad máxima de anidación
+    
+    Un único recorrido iterativo: cuenta nodos por tipo y lleva la
+    profundidad de funciones/clases en la pila, sin un visit_* por nodo.
+    """
+    counts: Dict[type, int] = {}
+    max_depth = 0
+    stack = [(tree, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_type = type(node)
+        counts[node_type] = counts.get(node_type, 0) + 1
+        if node_type in _SCOPE_NODES:
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        stack.extend((child, depth) for child in ast.iter_child_nodes(node))
+    
+    return {
+        "cyclomatic_complexity": 1 + sum(counts.get(node_type, 0) for node_type in _BRANCH_NODES),
+        "function_count": counts.get(ast.FunctionDef, 0),
+        "class_count": counts.get(ast.ClassDef, 0),
+        "max_depth": max_depth
+    }
+
+def _check_python_patterns(tree: ast.AST, file_path: str, data: bytes) -> List[PerformanceIssue]:
+    """Verificar patrones de rendimiento y seguridad en un solo recorrido del AST"""
+    visitor = _PythonRuleVisitor(file_path, data)
+    visitor.visit(tree)
+    return visitor.issues
+
+def _analyze_python_source(file_path: str, data: bytes) -> Tuple[List[PerformanceIssue], Optional[str]]:
+    """Analizar código Python; devuelve (issues, error). Se puede ejecutar en otro proceso"""
+    # Sin bucles, eval/exec ni SQL ninguna regla puede dispararse: no parsear
+    if not _RE_PYTHON_RULE_TRIGGERS.search(data):
+        return [], None
+    try:
+        # ast.parse decodifica los bytes según PEP 263; no hace falta un str intermedio
+        tree = ast.parse(data, filename=file_path)
+        # Analizar el AST para problemas comunes (rendimiento y seguridad)
+        return _check_python_patterns(tree, file_path, data), None
+    except Exception as e:
+        return [], str(e)
+
+@lru_cache(maxsize=None)
+def _js_parser(grammar: str) -> Tuple[Any, Any]:
+    """Parser de tree-sitter y query de useEffect por gramática, creados una vez por proceso"""
+    return get_parser(grammar), get_language(grammar).query(_USE_EFFECT_QUERY)
+
+def _use_effect_without_deps(file_path: str, data: bytes) -> List[int]:
+    """Líneas (1-based) donde se llama a useEffect sin array de dependencias"""
+    if b'useEffect' not in data:
+        return []
+    # La gramática tsx también cubre .js/.jsx; .ts usa la de TypeScript (<T>expr)
+    parser, query = _js_parser('typescript' if file_path.endswith('.ts') else 'tsx')
+    tree = parser.parse(data)
+    return [
+        node.start_point[0] + 1
+        for node, capture in query.captures(tree.root_node)
+        if capture == 'arguments' and node.named_child_count < 2
+    ]
+
+def _analyze_js_source(file_path: str, data: bytes) -> Tuple[List[PerformanceIssue], Optional[str]]:
+    """Analizar código JS/TS; devuelve (issues, error). Se puede ejecutar en otro proceso"""
+    issues = []
+    
+    try:
+        content = data.decode('utf-8')
+        lines = content.split('\n')
+        # Con tree-sitter, useEffect se analiza sobre el árbol sintáctico
+        use_effect_lines = _use_effect_without_deps(file_path, data) if HAS_TREE_SITTER else None
+        
+        # Patrones de rendimiento en JavaScript/TypeScript
+        for i, line in enumerate(lines, 1):
+            # Detectar console.log en producción
+            if 'console.log' in line and 'development' not in line:
+                issues.append(PerformanceIssue(
+                    type=OptimizationType.PERFORMANCE,
+                    severity=SeverityLevel.LOW,
+                    file_path=file_path,
+                    line_number=i,
+                    description="console.log encontrado - puede afectar rendimiento en producción",
+                    recommendation="Remover console.log o usar logger condicional",
+                    code_snippet=line.strip()
+                ))
+            
+            # Detectar bucles innecesarios en DOM
+            if _RE_DOM_QUERY_IN_LOOP.search(line):
+                issues.append(PerformanceIssue(
+                    type=OptimizationType.FRONTEND,
+                    severity=SeverityLevel.MEDIUM,
+                    file_path=file_path,
+                    line_number=i,
+                    description="Query DOM dentro de bucle",
+                    recommendation="Cachear referencias DOM fuera del bucle",
+                    code_snippet=line.strip()
+                ))
+            
+            # Detectar imágenes sin optimizar
+            if _RE_IMG_SRC.search(line):
+                if not _RE_LAZY.search(line):
+                    issues.append(PerformanceIssue(
+                        type=OptimizationType.FRONTEND,
+                        severity=SeverityLevel.MEDIUM,
+                        file_path=file_path,
+                        line_number=i,
+                        description="Imagen sin lazy loading",
+                        recommendation="Agregar loading='lazy' a las imágenes",
+                        code_snippet=line.strip()
+                    ))
+            
+            # Detectar useEffect sin dependencias (heurística por líneas sin tree-sitter)
+            if use_effect_lines is None and 'useEffect(' in line and i < len(lines) - 1:
+                next_lines = '\n'.join(lines[i:i+5])
+                if '},[])' not in next_lines and '},[' not in next_lines:
+                    issues.append(PerformanceIssue(
+                        type=OptimizationType.FRONTEND,
+                        severity=SeverityLevel.MEDIUM,
+                        file_path=file_path,
+                        line_number=i,
+                        description="useEffect sin array de dependencias",
+                        recommendation="Agregar array de dependencias a useEffect",
+                        code_snippet=line.strip()
+                    ))
+        
+        if use_effect_lines:
+            for line_number in use_effect_lines:
+                issues.append(PerformanceIssue(
+                    type=OptimizationType.FRONTEND,
+                    severity=SeverityLevel.MEDIUM,
+                    file_path=file_path,
+                    line_number=line_number,
+                    description="useEffect sin array de dependencias",
+                    recommendation="Agregar array de dependencias a useEffect",
+                    code_snippet=lines[line_number-1].strip()
+                ))
+            issues.sort(key=lambda issue: issue.line_number)
+    
+    except Exception as e:
+        return issues, str(e)
+    
+    return issues, None
+
+@lru_cache(maxsize=1)
+def _load_performance_patterns() -> Mapping[str, Any]:
+    """Patrones de rendimiento, cargados una vez por proceso y compartidos (solo lectura)"""
+    return MappingProxyType({})
+
+@lru_cache(maxsize=1)
+def _load_security_patterns() -> Mapping[str, Any]:
+    """Patrones de seguridad, cargados una vez por proceso y compartidos (solo lectura)"""
+    return MappingProxyType({})
+
+def _find_source_files(project_path: Path) -> Tuple[List[Path], List[Path]]:
+    """
+    Buscar archivos Python y JS/TS recorriendo el proyecto una sola vez
+    
+    Omite directorios sin código propio (dependencias, entornos, VCS).
+    """
+    python_files: List[Path] = []
+    js_files: List[Path] = []
+    for dirpath, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = sorted(d for d in dirnames if d not in _IGNORED_DIRECTORIES)
+        directory = Path(dirpath)
+        for filename in sorted(filenames):
+            if filename.endswith('.py'):
+                python_files.append(directory / filename)
+            elif filename.endswith(_JS_SUFFIXES):
+                js_files.append(directory / filename)
+    return python_files, js_files
+
+def _json_default(obj: Any) -> Any:
+    """Serializar dataclasses con el módulo json estándar"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_json(path: Path, data: Any, indent: bool = False) -> None:
+    """Escribir data como JSON UTF-8; con orjson las dataclasses se serializan sin copiarlas"""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        path.write_text(
+            json.dumps(data, default=_json_default, indent=2 if indent else None),
+            encoding="utf-8"
+        )
+
+def _issue_to_dict(issue: PerformanceIssue) -> Dict[str, Any]:
+    """Serializar un issue para la caché de análisis"""
+    data = asdict(issue)
+    data["type"] = issue.type.value
+    data["severity"] = issue.severity.value
+    return data
+
+def _issue_from_dict(data: Dict[str, Any]) -> PerformanceIssue:
+    """Reconstruir un issue guardado en la caché de análisis"""
+    issue = PerformanceIssue(**data)
+    issue.type = OptimizationType(issue.type)
+    # Los textos se repiten en miles de issues: compartir una sola copia
+    issue.description = sys.intern(issue.description)
+    issue.recommendation = sys.intern(issue.recommendation)
+    issue.severity = SeverityLevel(issue.severity)
+    return issue
+
+def _load_analysis_cache(cache_file: Path) -> Dict[str, Any]:
+    """Cargar la caché {ruta: [sha256, issues]}; vacía si no existe, es inválida o de otra versión"""
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _ANALYSIS_CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
 class PerformanceAgent(GenesisAgent):
     """
     Agente de Performance - Optimización y seguridad
@@ -103,6 +613,9 @@ class PerformanceAgent(GenesisAgent):
         self.performance_patterns = self._load_performance_patterns()
         self.security_patterns = self._load_security_patterns()
         
+        # Análisis por (ruta, tamaño, mtime) hechos en esta sesión (LRU)
+        self._session_analyses: "OrderedDict[Tuple[Any, ...], Tuple[str, List[PerformanceIssue]]]" = OrderedDict()
+        
     async def initialize(self):
         """Inicialización del agente de performance"""
         self.logger.info("⚡ Inicializando Performance Agent")
@@ -215,20 +728,14 @@ class PerformanceAgent(GenesisAgent):
         project_path = Path(params.get("project_path", "./"))
         include_security = params.get("include_security", False)
         
-        detected_issues = []
-        
-        # Analizar archivos Python (backend)
-        python_files = list(project_path.glob("**/*.py"))
-        for py_file in python_files:
-            issues = await self._analyze_python_file(py_file)
-            detected_issues.extend(issues)
+        # Archivos Python (backend) y TypeScript/JavaScript (frontend) en un solo recorrido
+        python_files, js_files = _find_source_files(project_path)
         
-        # Analizar archivos TypeScript/JavaScript (frontend)
-        js_files = list(project_path.glob("**/*.ts")) + list(project_path.glob("**/*.tsx")) + \
-                   list(project_path.glob("**/*.js")) + list(project_path.glob("**/*.jsx"))
-        for js_file in js_files:
-            issues = await self._analyze_js_file(js_file)
-            detected_issues.extend(issues)
+        # Cada archivo se analiza de forma independiente
+        jobs = [(_analyze_python_source, py_file) for py_file in python_files]
+        jobs.extend((_analyze_js_source, js_file) for js_file in js_files)
+        cache_file = project_path / _ANALYSIS_CACHE_FILE if params.get("use_cache", True) else None
+        detected_issues = await self._analyze_files(jobs, cache_file)
         
         # Analizar configuraciones
         config_issues = await self._analyze_configurations(project_path)
@@ -244,181 +751,108 @@ class PerformanceAgent(GenesisAgent):
         return {
             "detected_issues": detected_issues,
             "total_issues": len(detected_issues),
-            "critical_issues": len([i for i in detected_issues if i.severity == SeverityLevel.CRITICAL]),
+            "critical_issues": sum(1 for i in detected_issues if i.severity == SeverityLevel.CRITICAL),
             "files_analyzed": len(python_files) + len(js_files)
         }
     
     async def _analyze_python_file(self, file_path: Path) -> List[PerformanceIssue]:
         """Analizar archivo Python para issues de rendimiento"""
-        issues = []
-        
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            tree = ast.parse(content)
-            
-            # Analizar el AST para problemas comunes
-            issues.extend(self._check_python_performance_patterns(tree, file_path, content))
-            issues.extend(self._check_python_security_patterns(tree, file_path, content))
-            
-        except Exception as e:
-            self.logger.warning(f"Error analizando {file_path}: {e}")
-        
-        return issues
-    
-    def _check_python_performance_patterns(self, tree: ast.AST, file_path: Path, content: str) -> List[PerformanceIssue]:
-        """Verificar patrones de rendimiento en Python"""
-        issues = []
-        lines = content.split('\n')
-        
-        for node in ast.walk(tree):
-            # Detectar bucles innecesarios
-            if isinstance(node, ast.For):
-                # Verificar si hay llamadas a len() en cada iteración
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call) and isinstance(child.func, ast.Name) and child.func.id == 'len':
-                        issues.append(PerformanceIssue(
-                            type=OptimizationType.PERFORMANCE,
-                            severity=SeverityLevel.MEDIUM,
-                            file_path=str(file_path),
-                            line_number=node.lineno,
-                            description="Llamada a len() dentro de bucle",
-                            recommendation="Calcular len() una vez antes del bucle",
-                            code_snippet=lines[node.lineno-1] if node.lineno <= len(lines) else ""
-                        ))
-            
-            # Detectar concatenación de strings en bucles
-            if isinstance(node, (ast.For, ast.While)):
-                for child in ast.walk(node):
-                    if isinstance(child, ast.AugAssign) and isinstance(child.op, ast.Add):
-                        if isinstance(child.target, ast.Name):
-                            issues.append(PerformanceIssue(
-                                type=OptimizationType.PERFORMANCE,
-                                severity=SeverityLevel.MEDIUM,
-                                file_path=str(file_path),
-                                line_number=child.lineno,
-                                description="Concatenación de strings en bucle",
-                                recommendation="Usar join() o lista + join() para mejor rendimiento",
-                                code_snippet=lines[child.lineno-1] if child.lineno <= len(lines) else ""
-                            ))
-            
-            # Detectar consultas N+1 (patrón común en ORMs)
-            if isinstance(node, ast.For):
-                for child in ast.walk(node.body[0] if node.body else node):
-                    if isinstance(child, ast.Attribute) and isinstance(child.value, ast.Name):
-                        if any(keyword in str(child.attr).lower() for keyword in ['query', 'filter', 'get']):
-                            issues.append(PerformanceIssue(
-                                type=OptimizationType.DATABASE,
-                                severity=SeverityLevel.HIGH,
-                                file_path=str(file_path),
-                                line_number=child.lineno,
-                                description="Posible problema N+1 en consultas de base de datos",
-                                recommendation="Usar prefetch_related() o select_related() para optimizar consultas",
-                                code_snippet=lines[child.lineno-1] if child.lineno <= len(lines) else ""
-                            ))
-        
-        return issues
-    
-    def _check_python_security_patterns(self, tree: ast.AST, file_path: Path, content: str) -> List[PerformanceIssue]:
-        """Verificar patrones de seguridad en Python"""
-        issues = []
-        lines = content.split('\n')
-        
-        for node in ast.walk(tree):
-            # Detectar eval() y exec()
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-                if node.func.id in ['eval', 'exec']:
-                    issues.append(PerformanceIssue(
-                        type=OptimizationType.SECURITY,
-                        severity=SeverityLevel.CRITICAL,
-                        file_path=str(file_path),
-                        line_number=node.lineno,
-                        description=f"Uso de {node.func.id}() - riesgo de seguridad",
-                        recommendation="Evitar eval() y exec(), usar alternativas más seguras",
-                        code_snippet=lines[node.lineno-1] if node.lineno <= len(lines) else ""
-                    ))
-            
-            # Detectar SQL queries no parametrizadas
-            if isinstance(node, ast.Str) or (isinstance(node, ast.Constant) and isinstance(node.value, str)):
-                value = node.value if isinstance(node, ast.Constant) else node.s
-                if any(keyword in value.upper() for keyword in ['SELECT', 'INSERT', 'UPDATE', 'DELETE']):
-                    if '%' in value or '.format(' in content[max(0, node.col_offset-50):node.col_offset+50]:
-                        issues.append(PerformanceIssue(
-                            type=OptimizationType.SECURITY,
-                            severity=SeverityLevel.HIGH,
-                            file_path=str(file_path),
-                            line_number=node.lineno,
-                            description="Posible SQL injection - query no parametrizada",
-                            recommendation="Usar queries parametrizadas o ORMs seguros",
-                            code_snippet=lines[node.lineno-1] if node.lineno <= len(lines) else ""
-                        ))
-        
-        return issues
+        return await self._analyze_files([(_analyze_python_source, file_path)])
     
     async def _analyze_js_file(self, file_path: Path) -> List[PerformanceIssue]:
         """Analizar archivo JS/TS para issues de rendimiento"""
-        issues = []
-        
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
+        return await self._analyze_files([(_analyze_js_source, file_path)])
+    
+    async def _analyze_files(
+        self,
+        jobs: List[Tuple[Callable[[str, bytes], Tuple[List[PerformanceIssue], Optional[str]]], Path]],
+        cache_file: Optional[Path] = None
+    ) -> List[PerformanceIssue]:
+        """
+        Ejecutar los análisis (analizador, archivo) y unir sus issues en orden
+        
+        Dentro de la sesión del agente, un archivo con el mismo tamaño y
+        mtime reutiliza su análisis anterior sin leerse ni parsearse. Con
+        cache_file, los archivos cuyo SHA-256 no cambió desde la última
+        ejecución reutilizan los issues guardados sin volver a parsearse.
+        El resto es CPU-bound e independiente por archivo: a partir de
+        _PROCESS_POOL_MIN_FILES archivos se reparte en un pool de procesos.
+        """
+        cached = _load_analysis_cache(cache_file) if cache_file is not None else {}
+        updated: Dict[str, Any] = {}
+        results: List[Tuple[List[PerformanceIssue], Optional[str]]] = [([], None)] * len(jobs)
+        session = self._session_analyses
+        session_keys: List[Optional[Tuple[Any, ...]]] = [None] * len(jobs)
+        pending = []
+        
+        for index, (analyzer, file_path) in enumerate(jobs):
+            path_str = str(file_path)
+            try:
+                stat = file_path.stat()
+                session_key = (path_str, stat.st_size, stat.st_mtime_ns)
+                previous = session.get(session_key)
+                if previous is not None:
+                    session.move_to_end(session_key)
+                    digest, file_issues = previous
+                    results[index] = (file_issues, None)
+                    entry = cached.get(path_str)
+                    if entry is not None and entry[0] == digest:
+                        updated[path_str] = entry
+                    else:
+                        updated[path_str] = [digest, [_issue_to_dict(issue) for issue in file_issues]]
+                    continue
+                data = file_path.read_bytes()
+            except OSError as e:
+                results[index] = ([], str(e))
+                continue
             
-            # Patrones de rendimiento en JavaScript/TypeScript
-            for i, line in enumerate(lines, 1):
-                # Detectar console.log en producción
-                if 'console.log' in line and 'development' not in line:
-                    issues.append(PerformanceIssue(
-                        type=OptimizationType.PERFORMANCE,
-                        severity=SeverityLevel.LOW,
-                        file_path=str(file_path),
-                        line_number=i,
-                        description="console.log encontrado - puede afectar rendimiento en producción",
-                        recommendation="Remover console.log o usar logger condicional",
-                        code_snippet=line.strip()
-                    ))
-                
-                # Detectar bucles innecesarios en DOM
-                if re.search(r'for.*document\.querySelector|while.*document\.querySelector', line):
-                    issues.append(PerformanceIssue(
-                        type=OptimizationType.FRONTEND,
-                        severity=SeverityLevel.MEDIUM,
-                        file_path=str(file_path),
-                        line_number=i,
-                        description="Query DOM dentro de bucle",
-                        recommendation="Cachear referencias DOM fuera del bucle",
-                        code_snippet=line.strip()
-                    ))
-                
-                # Detectar imágenes sin optimizar
-                if re.search(r'<img.*src=.*\.(jpg|jpeg|png)', line):
-                    if 'lazy' not in line.lower():
-                        issues.append(PerformanceIssue(
-                            type=OptimizationType.FRONTEND,
-                            severity=SeverityLevel.MEDIUM,
-                            file_path=str(file_path),
-                            line_number=i,
-                            description="Imagen sin lazy loading",
-                            recommendation="Agregar loading='lazy' a las imágenes",
-                            code_snippet=line.strip()
-                        ))
-                
-                # Detectar useEffect sin dependencias
-                if 'useEffect(' in line and i < len(lines) - 1:
-                    next_lines = '\n'.join(lines[i:i+5])
-                    if '},[])' not in next_lines and '},[' not in next_lines:
-                        issues.append(PerformanceIssue(
-                            type=OptimizationType.FRONTEND,
-                            severity=SeverityLevel.MEDIUM,
-                            file_path=str(file_path),
-                            line_number=i,
-                            description="useEffect sin array de dependencias",
-                            recommendation="Agregar array de dependencias a useEffect",
-                            code_snippet=line.strip()
-                        ))
-        
-        except Exception as e:
-            self.logger.warning(f"Error analizando {file_path}: {e}")
-        
-        return issues
+            session_keys[index] = session_key
+            digest = hashlib.sha256(data).hexdigest()
+            entry = cached.get(path_str)
+            if entry is not None and entry[0] == digest:
+                file_issues = [_issue_from_dict(item) for item in entry[1]]
+                results[index] = (file_issues, None)
+                updated[path_str] = entry
+                self._remember_analysis(session_key, digest, file_issues)
+            else:
+                pending.append((index, analyzer, path_str, data, digest))
+        
+        if len(pending) < _PROCESS_POOL_MIN_FILES:
+            analyzed = [analyzer(path_str, data) for _, analyzer, path_str, data, _ in pending]
+        else:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                analyzed = await asyncio.gather(*(
+                    loop.run_in_executor(pool, analyzer, path_str, data)
+                    for _, analyzer, path_str, data, _ in pending
+                ))
+        
+        for (index, _, path_str, _, digest), result in zip(pending, analyzed):
+            results[index] = result
+            issues, error = result
+            if error is None:
+                updated[path_str] = [digest, [_issue_to_dict(issue) for issue in issues]]
+                self._remember_analysis(session_keys[index], digest, issues)
+        
+        if cache_file is not None and (pending or updated.keys() != cached.keys()):
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                _write_json(cache_file, {"version": _ANALYSIS_CACHE_VERSION, "files": updated})
+            except OSError as e:
+                self.logger.warning(f"No se pudo guardar la caché de análisis {cache_file}: {e}")
+        
+        for (_, file_path), (_, error) in zip(jobs, results):
+            if error is not None:
+                self.logger.warning(f"Error analizando {file_path}: {error}")
+        # Una sola lista del tamaño final, sin crecer archivo a archivo
+        return list(chain.from_iterable(file_issues for file_issues, _ in results))
+    
+    def _remember_analysis(self, key: Tuple[Any, ...], digest: str, issues: List[PerformanceIssue]) -> None:
+        """Guardar el análisis de un archivo para la sesión, descartando los más antiguos"""
+        session = self._session_analyses
+        session[key] = (digest, issues)
+        if len(session) > _SESSION_ANALYSES_SIZE:
+            session.popitem(last=False)
     
     async def _optimize_backend(self, backend_path: Path, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Optimizar código backend"""
@@ -479,99 +913,32 @@ class PerformanceAgent(GenesisAgent):
             "files_modified": files_modified
         }
     
+    @staticmethod
     def analyze_python_complexity(code: str) -> Dict[str, Any]:
         """Analizar complejidad del código Python"""
         try:
-             tree = ast.parse(code)
-                
-             complexity_visitor = ComplexityVisitor()
-             complexity_visitor.visit(tree)
-                
-             return {
-                "cyclomatic_complexity": complexity_visitor.complexity,
-                "function_count": complexity_visitor.function_count,
-                "class_count": complexity_visitor.class_count,
-                "max_depth": complexity_visitor.max_depth
-            }
+            tree = ast.parse(code)
         except SyntaxError:
-             return {"error": "Syntax error in code"}
-
-    class ComplexityVisitor(ast.NodeVisitor):
-        """Visitor para calcular complejidad ciclomática"""
-        
-        def __init__(self):
-            self.complexity = 1  # Base complexity
-            self.function_count = 0
-            self.class_count = 0
-            self.max_depth = 0
-            self.current_depth = 0
-        
-        def visit_FunctionDef(self, node):
-            self.function_count += 1
-            self.current_depth += 1
-            self.max_depth = max(self.max_depth, self.current_depth)
-            self.generic_visit(node)
-            self.current_depth -= 1
-        
-        def visit_ClassDef(self, node):
-            self.class_count += 1
-            self.current_depth += 1
-            self.max_depth = max(self.max_depth, self.current_depth)
-            self.generic_visit(node)
-            self.current_depth -= 1
-        
-        def visit_If(self, node):
-            self.complexity += 1
-            self.generic_visit(node)
-        
-        def visit_While(self, node):
-            self.complexity += 1
-            self.generic_visit(node)
-        
-        def visit_For(self, node):
-            self.complexity += 1
-            self.generic_visit(node)
-
+            return {"error": "Syntax error in code"}
+        return _complexity_metrics(tree)
     
-    def _calculate_performance_score(self, issues: List[PerformanceIssue], optimizations: List[str]) -> float:
+    def _calculate_performance_score(self, issues: Iterable[PerformanceIssue], optimizations: List[str]) -> float:
         """Calcular puntuación de rendimiento"""
-        # Empezar con score perfecto
-        score = 10.0
-        
-        # Restar puntos por issues
-        for issue in issues:
-            if issue.severity == SeverityLevel.CRITICAL:
-                score -= 2.0
-            elif issue.severity == SeverityLevel.HIGH:
-                score -= 1.0
-            elif issue.severity == SeverityLevel.MEDIUM:
-                score -= 0.5
-            elif issue.severity == SeverityLevel.LOW:
-                score -= 0.2
-        
-        # Sumar puntos por optimizaciones aplicadas
+        # Empezar con score perfecto, restar puntos por issues y sumar por optimizaciones aplicadas
+        severities = Counter(issue.severity for issue in issues)
+        score = 10.0 - sum(_PERFORMANCE_PENALTIES[severity] * count for severity, count in severities.items())
         score += len(optimizations) * 0.1
         
         return max(0.0, min(10.0, score))
     
-    def _calculate_security_score(self, issues: List[PerformanceIssue]) -> float:
+    def _calculate_security_score(self, issues: Iterable[PerformanceIssue]) -> float:
         """Calcular puntuación de seguridad"""
-        security_issues = [i for i in issues if i.type == OptimizationType.SECURITY]
+        severities = Counter(issue.severity for issue in issues if issue.type == OptimizationType.SECURITY)
         
-        if not security_issues:
+        if not severities:
             return 10.0
         
-        score = 10.0
-        for issue in security_issues:
-            if issue.severity == SeverityLevel.CRITICAL:
-                score -= 3.0
-            elif issue.severity == SeverityLevel.HIGH:
-                score -= 2.0
-            elif issue.severity == SeverityLevel.MEDIUM:
-                score -= 1.0
-            elif issue.severity == SeverityLevel.LOW:
-                score -= 0.5
-        
+        score = 10.0 - sum(_SECURITY_PENALTIES[severity] * count for severity, count in severities.items())
         return max(0.0, score)
     
     # Handlers MCP
@@ -628,13 +995,13 @@ class PerformanceAgent(GenesisAgent):
         return result
     
     # Métodos auxiliares (implementación simplificada)
-    def _load_performance_patterns(self) -> Dict[str, Any]:
+    def _load_performance_patterns(self) -> Mapping[str, Any]:
         """Cargar patrones de rendimiento"""
-        return {}
+        return _load_performance_patterns()
     
-    def _load_security_patterns(self) -> Dict[str, Any]:
+    def _load_security_patterns(self) -> Mapping[str, Any]:
         """Cargar patrones de seguridad"""
-        return {}
+        return _load_security_patterns()
     
     async def _load_optimization_rules(self):
         """Cargar reglas de optimización"""
@@ -656,6 +1023,8 @@ class PerformanceAgent(GenesisAgent):
                 lines = py_file.read_text(encoding="utf-8").splitlines()
             except Exception:
                 continue
+            # Ruta como str una sola vez por archivo, no una por issue
+            file_path = str(py_file)
 
             modified = False
             for idx, line in enumerate(lines):
@@ -664,7 +1033,7 @@ class PerformanceAgent(GenesisAgent):
                         PerformanceIssue(
                             type=OptimizationType.SECURITY,
                             severity=SeverityLevel.CRITICAL,
-                            file_path=str(py_file),
+                            file_path=file_path,
                             line_number=idx + 1,
                             description="Uso inseguro de eval/exec",
                             recommendation="Reemplazar por alternativas seguras",
@@ -674,12 +1043,12 @@ class PerformanceAgent(GenesisAgent):
                     lines[idx] = line + "  # TODO: fix security issue"
                     modified = True
 
-                if re.search(r"(?i)(password|secret|token)\s*=\s*['\"]", line):
+                if _RE_HARDCODED_SECRET.search(line):
                     issues.append(
                         PerformanceIssue(
                             type=OptimizationType.SECURITY,
                             severity=SeverityLevel.HIGH,
-                            file_path=str(py_file),
+                            file_path=file_path,
                             line_number=idx + 1,
                             description="Credencial hardcodeada",
                             recommendation="Mover secreto a variables de entorno",
@@ -691,13 +1060,11 @@ class PerformanceAgent(GenesisAgent):
 
             if modified:
                 py_file.write_text("\n".join(lines))
-                files_modified.append(str(py_file))
+                files_modified.append(file_path)
 
         report_file = project_path / ".genesis" / "security_audit.json"
         report_file.parent.mkdir(exist_ok=True)
-        report_file.write_text(
-            json.dumps([issue.__dict__ for issue in issues], indent=2)
-        )
+        _write_json(report_file, issues, indent=True)
 
         return {
             "issues": issues,
@@ -718,15 +1085,17 @@ class PerformanceAgent(GenesisAgent):
                 lines = py_file.read_text(encoding="utf-8").splitlines()
             except Exception:
                 continue
+            # Ruta como str una sola vez por archivo, no una por issue
+            file_path = str(py_file)
 
             modified = False
             for idx, line in enumerate(lines):
-                if re.search(r"SELECT\s+\*", line, re.IGNORECASE):
+                if _RE_SELECT_STAR.search(line):
                     issues.append(
                         PerformanceIssue(
                             type=OptimizationType.DATABASE,
                             severity=SeverityLevel.MEDIUM,
-                            file_path=str(py_file),
+                            file_path=file_path,
                             line_number=idx + 1,
                             description="Uso de SELECT * en consulta",
                             recommendation="Seleccionar solo columnas necesarias",
@@ -735,14 +1104,14 @@ class PerformanceAgent(GenesisAgent):
                     )
                     lines[idx] = line + "  # TODO optimize query"
                     modified = True
-                    optimizations.append(f"Marcada consulta SELECT * en {py_file}")
+                    optimizations.append(f"Marcada consulta SELECT * en {file_path}")
 
-                if re.search(r"\.objects\.all\(\)", line):
+                if _RE_OBJECTS_ALL.search(line):
                     issues.append(
                         PerformanceIssue(
                             type=OptimizationType.DATABASE,
                             severity=SeverityLevel.MEDIUM,
-                            file_path=str(py_file),
+                            file_path=file_path,
                             line_number=idx + 1,
                             description="Uso potencial de ORM N+1",
                             recommendation="Utilizar select_related/prefetch_related",
@@ -751,11 +1120,11 @@ class PerformanceAgent(GenesisAgent):
                     )
                     lines[idx] = line + "  # TODO optimize ORM query"
                     modified = True
-                    optimizations.append(f"Marcado objects.all() en {py_file}")
+                    optimizations.append(f"Marcado objects.all() en {file_path}")
 
             if modified:
                 py_file.write_text("\n".join(lines))
-                files_modified.append(str(py_file))
+                files_modified.append(file_path)
 
         return {
             "optimizations": optimizations,
@@ -830,10 +1199,8 @@ class PerformanceAgent(GenesisAgent):
         recommendations = []
         
         # Agrupar por tipo
-        issue_types = {}
+        issue_types: DefaultDict[OptimizationType, List[PerformanceIssue]] = defaultdict(list)
         for issue in issues:
-            if issue.type not in issue_types:
-                issue_types[issue.type] = []
             issue_types[issue.type].append(issue)
         
         # Generar recomendaciones por tipo
@@ -853,7 +1220,10 @@ class PerformanceAgent(GenesisAgent):
     
     async def _generate_optimization_report(self, project_path: Path, result: OptimizationResult):
         """Generar reporte de optimización"""
-        report_content = f"""# Reporte de Optimización
+        report_file = project_path / ".genesis" / "optimization_report.md"
+        
+        # Construir el reporte por partes y unirlo una sola vez
+        parts = [f"""# Reporte de Optimización
 
 ## Resumen
 - **Performance Score**: {result.performance_score:.1f}/10
@@ -864,35 +1234,28 @@ class PerformanceAgent(GenesisAgent):
 
 ## Optimizaciones Aplicadas
 
-"""
+"""]
+        append = parts.append
         
-        for opt in result.applied_optimizations:
-            report_content += f"- ✅ {opt}\n"
+        parts.extend(f"- ✅ {opt}\n" for opt in result.applied_optimizations)
         
-        report_content += "\n## Issues Detectados\n\n"
+        append("\n## Issues Detectados\n\n")
         
+        # Un único f-string por issue
         for issue in result.detected_issues:
-            severity_emoji = {
-                SeverityLevel.CRITICAL: "🔴",
-                SeverityLevel.HIGH: "🟠", 
-                SeverityLevel.MEDIUM: "🟡",
-                SeverityLevel.LOW: "🟢"
-            }
-            
-            report_content += f"### {severity_emoji[issue.severity]} {issue.description}\n\n"
-            report_content += f"- **Archivo**: {issue.file_path}\n"
-            if issue.line_number:
-                report_content += f"- **Línea**: {issue.line_number}\n"
-            report_content += f"- **Recomendación**: {issue.recommendation}\n\n"
+            line = f"- **Línea**: {issue.line_number}\n" if issue.line_number else ""
+            append(
+                f"### {_SEVERITY_EMOJI[issue.severity]} {issue.description}\n\n"
+                f"- **Archivo**: {issue.file_path}\n"
+                f"{line}"
+                f"- **Recomendación**: {issue.recommendation}\n\n"
+            )
         
-        report_content += "\n## Recomendaciones\n\n"
+        append("\n## Recomendaciones\n\n")
         
-        for rec in result.recommendations:
-            report_content += f"- 💡 {rec}\n"
+        parts.extend(f"- 💡 {rec}\n" for rec in result.recommendations)
         
         # Guardar reporte
-        report_file = project_path / ".genesis" / "optimization_report.md"
-        report_file.parent.mkdir(exist_ok=True)
-        report_file.write_text(report_content)
+        write_bytes(report_file, "".join(parts).encode("utf-8"), create_dirs=True)
         
         self.logger.info(f"📄 Reporte de optimización generado: {report_file}")
\ No newline at end of file
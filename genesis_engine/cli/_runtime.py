@@ -0,0 +1,51 @@
+"""
+Bucle de eventos compartido por los comandos de la CLI
+"""
+
+import asyncio
+import atexit
+from typing import Awaitable, Optional, TypeVar
+
+try:  # pragma: no cover - opcional según entorno
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Crear el bucle la primera vez que se necesita (uvloop si está disponible)"""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
+        asyncio.set_event_loop(_LOOP)
+    return _LOOP
+
+
+def _close_loop() -> None:
+    """Cancelar tareas pendientes y cerrar el bucle al salir del proceso"""
+    global _LOOP
+    loop, _LOOP = _LOOP, None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+
+atexit.register(_close_loop)
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Ejecutar una corrutina reutilizando el bucle de eventos del proceso"""
+    return _get_loop().run_until_complete(coro)
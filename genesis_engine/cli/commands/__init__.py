@@ -1,5 +1,20 @@
 """Genesis Engine CLI Commands."""
 
-from . import doctor, deploy, generate, create, init, utils
+import importlib
 
 __all__ = ["doctor", "deploy", "generate", "create", "init", "utils"]
+
+# Los submódulos se importan al primer acceso (PEP 562)
+_LAZY = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
@@ -4,17 +4,20 @@ Genesis Engine CLI Commands
 Implementación de todos los comandos de la CLI de Genesis Engine.
 """
 
-import asyncio
+import os
+import shutil
+import subprocess
 import typer
 from pathlib import Path
-from typing import Optional, List
+from itertools import chain, islice
+from typing import Dict, List, Optional, Set
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.prompt import Prompt
 
-from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, ProjectGenerationRequest
-from genesis_engine.core.config import GenesisConfig, Features
+from genesis_engine.cli._runtime import run_async
+from genesis_engine.cli.commands.utils import load_project_metadata
 
 try:
     from genesis_engine.utils.validation import validate_project_name, validate_stack_config
@@ -27,6 +30,22 @@ except Exception:  # pragma: no cover - fallback if validation utils missing
 
 console = Console()
 
+# Stack predefinido que usa cada template
+_TEMPLATE_STACKS = {
+    "saas-basic": "golden-path",
+    "golden-path": "golden-path",
+    "api-first": "api-first",
+    "ecommerce": "ecommerce",
+}
+
+# Campos de genesis.json que se muestran en el estado del proyecto
+_PROJECT_INFO_FIELDS = (
+    ("Nombre", "name"),
+    ("Versión", "version"),
+    ("Generado", "generated_at"),
+    ("Generator", "generator"),
+)
+
 # ===== CREATE COMMAND =====
 
 create_app = typer.Typer(name="create", help="🏗️ Crear nuevo proyecto Genesis")
@@ -45,6 +64,7 @@ def create_project(
     dry_run: bool = typer.Option(False, "--dry-run", help="Simular sin crear archivos")
 ):
     """Crear un nuevo proyecto Genesis"""
+    from genesis_engine.core.config import GenesisConfig
     
     console.print(Panel.fit(
         "🚀 Genesis Engine Project Creator",
@@ -60,13 +80,8 @@ def create_project(
         raise typer.Exit(1)
     
     # Configurar stack
-    stack = {}
-    if template in ["saas-basic", "golden-path"]:
-        stack = GenesisConfig.get_stack_config("golden-path")
-    elif template == "api-first":
-        stack = GenesisConfig.get_stack_config("api-first") 
-    elif template == "ecommerce":
-        stack = GenesisConfig.get_stack_config("ecommerce")
+    preset = _TEMPLATE_STACKS.get(template)
+    stack = GenesisConfig.get_stack_config(preset) if preset else {}
     
     # Sobrescribir con opciones específicas
     if stack_backend:
@@ -84,10 +99,9 @@ def create_project(
             console.print(f"  • {error}")
         raise typer.Exit(1)
     
-    # Configurar características
-    project_features = features or []
-    if ai_ready:
-        project_features.extend(["ai_chat", "ai_assistant"])
+    # Configurar características (sin duplicados, en el orden indicado)
+    ai_features = ("ai_chat", "ai_assistant") if ai_ready else ()
+    project_features = list(dict.fromkeys(chain(features or (), ai_features)))
     
     # Modo interactivo
     if interactive and not dry_run:
@@ -121,7 +135,7 @@ def create_project(
     
     try:
         # Ejecutar creación asíncrona
-        result = asyncio.run(_create_project_async(project_config))
+        result = run_async(_create_project_async(project_config))
         
         if result.success:
             _show_success_message(name, output_dir, stack, project_features)
@@ -138,6 +152,8 @@ def create_project(
 
 async def _create_project_async(config):
     """Crear proyecto de manera asíncrona"""
+    from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, ProjectGenerationRequest
+    
     orchestrator = CoreOrchestrator()
     request = ProjectGenerationRequest(
         name=config.get("name", "project"),
@@ -149,6 +165,8 @@ async def _create_project_async(config):
 
 def _interactive_feature_selection(current_features: List[str]) -> List[str]:
     """Selección interactiva de características"""
+    from genesis_engine.core.config import Features
+    
     console.print("\n[bold]🎯 Seleccionar características:[/bold]")
     
     available_features = {
@@ -164,24 +182,37 @@ def _interactive_feature_selection(current_features: List[str]) -> List[str]:
         Features.MONITORING: "Monitoreo y logs",
     }
     
-    selected_features = list(current_features)
+    selected = set(current_features)
     
-    for feature, description in available_features.items():
-        default = feature in selected_features
-        include = typer.confirm(
-            f"  Incluir {description}?",
-            default=default
-        )
-        
-        if include and feature not in selected_features:
-            selected_features.append(feature)
-        elif not include and feature in selected_features:
-            selected_features.remove(feature)
+    # Mostrar todas las opciones y pedir la selección en un único prompt
+    options = list(available_features)
+    for index, (feature, description) in enumerate(available_features.items(), 1):
+        mark = "✅" if feature in selected else "⬜"
+        console.print(f"  {mark} {index}. {description}")
     
-    return selected_features
+    default = ",".join(
+        str(index) for index, feature in enumerate(options, 1) if feature in selected
+    )
+    answer = Prompt.ask("  Números a incluir (separados por coma)", default=default, console=console)
+    chosen = {
+        options[int(token) - 1]
+        for token in answer.replace(",", " ").split()
+        if token.isdecimal() and 0 < int(token) <= len(options)
+    }
+    
+    # Conservar el orden actual y las características que no están en la lista
+    result = [
+        feature for feature in current_features
+        if feature not in available_features or feature in chosen
+    ]
+    included = set(result)
+    result.extend(feature for feature in options if feature in chosen and feature not in included)
+    return result
 
 def _interactive_stack_configuration(current_stack: dict) -> dict:
     """Configuración interactiva del stack"""
+    from genesis_engine.core.config import GenesisConfig
+    
     console.print("\n[bold]⚙️ Configurar stack tecnológico:[/bold]")
     
     stack = dict(current_stack)
@@ -236,25 +267,28 @@ def _show_dry_run_summary(config: dict):
 
 def _show_success_message(name: str, output_dir: Path, stack: dict, features: List[str]):
     """Mostrar mensaje de éxito"""
-    console.print(f"\n[bold green]✅ Proyecto '{name}' creado exitosamente![/bold green]")
-    console.print(f"📁 Ubicación: [cyan]{output_dir}[/cyan]")
+    lines = [
+        f"\n[bold green]✅ Proyecto '{name}' creado exitosamente![/bold green]",
+        f"📁 Ubicación: [cyan]{output_dir}[/cyan]",
+    ]
     
     # Mostrar stack usado
-    console.print(f"\n[bold]📋 Stack generado:[/bold]")
-    for key, value in stack.items():
-        console.print(f"  • {key.title()}: [cyan]{value}[/cyan]")
+    lines.append("\n[bold]📋 Stack generado:[/bold]")
+    lines.extend(f"  • {key.title()}: [cyan]{value}[/cyan]" for key, value in stack.items())
     
     # Mostrar características
     if features:
-        console.print(f"\n[bold]🎯 Características incluidas:[/bold]")
-        for feature in features:
-            console.print(f"  • {feature}")
+        lines.append("\n[bold]🎯 Características incluidas:[/bold]")
+        lines.extend(f"  • {feature}" for feature in features)
     
     # Siguientes pasos
-    console.print(f"\n[bold yellow]🚀 Siguientes pasos:[/bold yellow]")
-    console.print(f"1. [dim]cd {name}[/dim]")
-    console.print("2. [dim]genesis deploy --local[/dim]")
-    console.print("3. [dim]genesis status[/dim]")
+    lines += [
+        "\n[bold yellow]🚀 Siguientes pasos:[/bold yellow]",
+        f"1. [dim]cd {name}[/dim]",
+        "2. [dim]genesis deploy --local[/dim]",
+        "3. [dim]genesis status[/dim]",
+    ]
+    console.print("\n".join(lines))
 
 # ===== DEPLOY COMMAND =====
 
@@ -280,7 +314,7 @@ def deploy_local(
         raise typer.Exit(1)
     
     try:
-        result = asyncio.run(_deploy_local_async(project_path, dev_mode, detached))
+        result = run_async(_deploy_local_async(project_path, dev_mode, detached))
         
         if result['success']:
             console.print("[green]✅ Despliegue completado[/green]")
@@ -336,9 +370,7 @@ def status_project(
     
     try:
         # Cargar metadata del proyecto
-        import json
-        with open(genesis_file, 'r') as f:
-            project_data = json.load(f)
+        project_data = load_project_metadata(genesis_file)
         
         _show_project_status(project_data, project_path)
         
@@ -353,56 +385,80 @@ def _show_project_status(project_data: dict, project_path: Path):
     table.add_column("Campo")
     table.add_column("Valor")
     
-    table.add_row("Nombre", project_data.get('name', 'N/A'))
-    table.add_row("Versión", project_data.get('version', 'N/A'))
-    table.add_row("Generado", project_data.get('generated_at', 'N/A'))
-    table.add_row("Generator", project_data.get('generator', 'N/A'))
+    for label, key in _PROJECT_INFO_FIELDS:
+        table.add_row(label, project_data.get(key, 'N/A'))
     
     console.print(table)
     
     # Archivos generados
     generated_files = project_data.get('generated_files', [])
     if generated_files:
-        console.print(f"\n[bold]📁 Archivos generados ({len(generated_files)}):[/bold]")
-        for file_path in generated_files[:10]:  # Mostrar solo los primeros 10
+        lines = [f"\n[bold]📁 Archivos generados ({len(generated_files)}):[/bold]"]
+        # Listar cada directorio una sola vez en lugar de un stat() por archivo
+        directory_entries: Dict[Path, Set[str]] = {}
+        for file_path in islice(generated_files, 10):  # Mostrar solo los primeros 10
             file_full_path = project_path / file_path
-            status = "✅" if file_full_path.exists() else "❌"
-            console.print(f"  {status} {file_path}")
+            entries = directory_entries.get(file_full_path.parent)
+            if entries is None:
+                entries = directory_entries[file_full_path.parent] = _list_directory(file_full_path.parent)
+            status = "✅" if file_full_path.name in entries else "❌"
+            lines.append(f"  {status} {file_path}")
         
         if len(generated_files) > 10:
-            console.print(f"  ... y {len(generated_files) - 10} archivos más")
+            lines.append(f"  ... y {len(generated_files) - 10} archivos más")
+        console.print("\n".join(lines))
     
     # Verificar servicios corriendo
     _check_running_services(project_path)
 
+def _list_directory(directory: Path) -> Set[str]:
+    """Nombres de las entradas de un directorio (vacío si no existe)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 def _check_running_services(project_path: Path):
     """Verificar servicios corriendo"""
     console.print("\n[bold]🔍 Verificando servicios:[/bold]")
     
     # Verificar Docker Compose
     docker_compose = project_path / "docker-compose.yml"
-    if docker_compose.exists():
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["docker-compose", "ps", "--services", "--filter", "status=running"],
-                cwd=project_path,
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                services = result.stdout.strip().split('\n')
-                console.print(f"  🐳 Docker Compose: [green]{len(services)} servicios corriendo[/green]")
-                for service in services:
-                    console.print(f"    • {service}")
-            else:
-                console.print("  🐳 Docker Compose: [yellow]No hay servicios corriendo[/yellow]")
-                
-        except FileNotFoundError:
+    if not docker_compose.exists():
+        console.print("  🐳 Docker Compose: [dim]No configurado[/dim]")
+        return
+    
+    # docker-compose clásico o el plugin "docker compose"
+    compose_bin = shutil.which("docker-compose")
+    if compose_bin:
+        command = [compose_bin]
+    else:
+        docker_bin = shutil.which("docker")
+        if not docker_bin:
             console.print("  🐳 Docker Compose: [red]Docker no encontrado[/red]")
+            return
+        command = [docker_bin, "compose"]
+    
+    try:
+        result = subprocess.run(
+            command + ["ps", "--services", "--filter", "status=running"],
+            cwd=project_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=5
+        )
+    except subprocess.TimeoutExpired:
+        console.print("  🐳 Docker Compose: [yellow]Sin respuesta de Docker[/yellow]")
+        return
+    
+    services = result.stdout.decode("utf-8", "replace").split() if result.returncode == 0 else []
+    if services:
+        console.print(f"  🐳 Docker Compose: [green]{len(services)} servicios corriendo[/green]")
+        for service in services:
+            console.print(f"    • {service}")
     else:
-        console.print("  🐳 Docker Compose: [dim]No configurado[/dim]")
+        console.print("  🐳 Docker Compose: [yellow]No hay servicios corriendo[/yellow]")
 
 # ===== OPTIMIZE COMMAND =====
 
@@ -422,7 +478,7 @@ def optimize_performance(
     console.print(f"⚡ Optimizando proyecto en: [cyan]{project_path}[/cyan]")
     
     try:
-        result = asyncio.run(_optimize_performance_async(
+        result = run_async(_optimize_performance_async(
             project_path, include_security, auto_fix
         ))
         
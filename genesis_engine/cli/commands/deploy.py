@@ -2,7 +2,6 @@
 Genesis Deploy Command
 """
 
-import asyncio
 from pathlib import Path
 from uuid import uuid4
 
@@ -10,6 +9,7 @@ from rich.console import Console
 from rich.panel import Panel
 
 from genesis_engine.agents.deploy import DeployAgent
+from genesis_engine.cli._runtime import run_async
 from genesis_engine.mcp.agent_base import AgentTask
 
 console = Console()
@@ -42,7 +42,7 @@ def deploy_command(environment: str, force: bool, auto_migrate: bool):
         )
         return await agent.execute_task(task)
 
-    result = asyncio.run(_run_deploy())
+    result = run_async(_run_deploy())
 
     if result.success:
         console.print("[green]✅ Despliegue completado[/green]")
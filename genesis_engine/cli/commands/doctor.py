@@ -5,121 +5,170 @@ Genesis Doctor Command - Diagnóstico del entorno
 import sys
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Tuple
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import print as rprint
 
-from genesis_engine.cli.commands.utils import check_dependencies
+from genesis_engine.cli.commands.utils import check_dependencies, load_project_metadata
 
 console = Console()
 
-def doctor_command():
-    """Comando para diagnosticar el entorno de desarrollo"""
-    
-    console.print(Panel.fit(
-        "[bold cyan]🔍 Genesis Engine - Diagnóstico del Entorno[/bold cyan]",
-        border_style="cyan"
-    ))
-    
-    # Crear tabla de resultados
-    table = Table(title="📋 Diagnóstico del Sistema")
-    table.add_column("Componente", style="cyan", no_wrap=True)
-    table.add_column("Estado", style="magenta")
-    table.add_column("Versión", style="green")
-    table.add_column("Notas", style="yellow")
+# Versión del intérprete: no cambia durante el proceso
+_PYTHON_VERSION = "{}.{}.{}".format(*sys.version_info[:3])
+_PYTHON_STATUS = "✅ OK" if sys.version_info >= (3, 8) else "❌ Muy antiguo"
 
-    checks = []
+# Segundos máximos de espera por cada herramienta externa
+_PROBE_TIMEOUT = 5
 
+def _run_version(cmd: List[str]) -> subprocess.CompletedProcess:
+    """Ejecutar un comando de versión capturando su salida"""
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=_PROBE_TIMEOUT)
+
+@lru_cache(maxsize=None)
+def _system_info() -> Tuple[str, str, str]:
+    """Sistema operativo, versión del kernel y arquitectura"""
+    return platform.system(), platform.release(), platform.machine()
+
+def _timeout_check(name: str) -> Tuple[str, str, str, str]:
+    """Fila de diagnóstico para una herramienta que no respondió"""
+    return (name, "⚠️ Timeout", "N/A", f"Comando no respondió en {_PROBE_TIMEOUT}s")
+
+def _check_pip() -> Tuple[str, str, str, str]:
+    """Verificar pip"""
     try:
-        check_dependencies()
-    except RuntimeError as exc:
-        rprint(f"[red]{exc}[/red]")
-        return False
-    
-    # 1. Verificar Python
-    python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-    python_status = "✅ OK" if sys.version_info >= (3, 8) else "❌ Muy antiguo"
-    checks.append(("Python", python_status, python_version, "Mínimo requerido: 3.8+"))
-    
-    # 2. Verificar pip
-    try:
-        pip_result = subprocess.run([sys.executable, "-m", "pip", "--version"], 
-                                  capture_output=True, text=True)
+        pip_result = _run_version([sys.executable, "-m", "pip", "--version"])
         if pip_result.returncode == 0:
             pip_version = pip_result.stdout.split()[1]
-            checks.append(("pip", "✅ OK", pip_version, ""))
-        else:
-            checks.append(("pip", "❌ Error", "N/A", "No se puede ejecutar pip"))
+            return ("pip", "✅ OK", pip_version, "")
+        return ("pip", "❌ Error", "N/A", "No se puede ejecutar pip")
+    except subprocess.TimeoutExpired:
+        return _timeout_check("pip")
     except Exception:
-        checks.append(("pip", "❌ Error", "N/A", "No encontrado"))
-    
-    # 3. Verificar Node.js
+        return ("pip", "❌ Error", "N/A", "No encontrado")
+
+def _check_node() -> Tuple[str, str, str, str]:
+    """Verificar Node.js"""
     try:
-        node_result = subprocess.run(["node", "--version"], 
-                                   capture_output=True, text=True)
+        node_result = _run_version(["node", "--version"])
         if node_result.returncode == 0:
             node_version = node_result.stdout.strip()
-            checks.append(("Node.js", "✅ OK", node_version, "Para proyectos frontend"))
-        else:
-            checks.append(("Node.js", "❌ Error", "N/A", "Requerido para frontend"))
+            return ("Node.js", "✅ OK", node_version, "Para proyectos frontend")
+        return ("Node.js", "❌ Error", "N/A", "Requerido para frontend")
+    except subprocess.TimeoutExpired:
+        return _timeout_check("Node.js")
     except FileNotFoundError:
-        checks.append(("Node.js", "⚠️ No encontrado", "N/A", "Opcional para algunos templates"))
-    
-    # 4. Verificar Docker
+        return ("Node.js", "⚠️ No encontrado", "N/A", "Opcional para algunos templates")
+
+def _check_docker() -> Tuple[str, str, str, str]:
+    """Verificar Docker"""
     try:
-        docker_result = subprocess.run(["docker", "--version"], 
-                                     capture_output=True, text=True)
+        docker_result = _run_version(["docker", "--version"])
         if docker_result.returncode == 0:
             docker_version = docker_result.stdout.split()[2].rstrip(',')
-            checks.append(("Docker", "✅ OK", docker_version, "Para despliegue"))
-        else:
-            checks.append(("Docker", "❌ Error", "N/A", "Requerido para deploy"))
+            return ("Docker", "✅ OK", docker_version, "Para despliegue")
+        return ("Docker", "❌ Error", "N/A", "Requerido para deploy")
+    except subprocess.TimeoutExpired:
+        return _timeout_check("Docker")
     except FileNotFoundError:
-        checks.append(("Docker", "⚠️ No encontrado", "N/A", "Necesario para contenedores"))
-    
-    # 5. Verificar Git
+        return ("Docker", "⚠️ No encontrado", "N/A", "Necesario para contenedores")
+
+def _check_git() -> Tuple[str, str, str, str]:
+    """Verificar Git"""
     try:
-        git_result = subprocess.run(["git", "--version"], 
-                                  capture_output=True, text=True)
+        git_result = _run_version(["git", "--version"])
         if git_result.returncode == 0:
             git_version = git_result.stdout.split()[2]
-            checks.append(("Git", "✅ OK", git_version, "Control de versiones"))
-        else:
-            checks.append(("Git", "❌ Error", "N/A", "Requerido"))
+            return ("Git", "✅ OK", git_version, "Control de versiones")
+        return ("Git", "❌ Error", "N/A", "Requerido")
+    except subprocess.TimeoutExpired:
+        return _timeout_check("Git")
     except FileNotFoundError:
-        checks.append(("Git", "❌ No encontrado", "N/A", "Instalar Git"))
-    
-    # 6. Verificar Genesis Engine
+        return ("Git", "❌ No encontrado", "N/A", "Instalar Git")
+
+def _check_github_connectivity() -> str:
+    """Mensaje de conectividad a GitHub"""
     try:
-        import genesis_engine
-        checks.append(("Genesis Engine", "✅ OK", genesis_engine.__version__, "¡Funcionando!"))
-    except ImportError:
-        checks.append(("Genesis Engine", "❌ Error", "N/A", "Problema de instalación"))
-    
-    # Agregar resultados a la tabla
-    for check in checks:
-        table.add_row(*check)
-    
-    console.print(table)
+        import httpx
+        # HEAD basta para comprobar la conexión y evita descargar el cuerpo
+        with httpx.Client(timeout=_PROBE_TIMEOUT) as client:
+            response = client.head("https://api.github.com")
+            if response.status_code == 405:
+                response = client.get("https://api.github.com")
+        if response.status_code == 200:
+            return "[green]✅ Conectividad a GitHub: OK[/green]"
+        return "[yellow]⚠️ Conectividad a GitHub: Limitada[/yellow]"
+    except Exception:
+        return "[red]❌ Conectividad a GitHub: Sin conexión[/red]"
+
+# Verificaciones de herramientas externas, en el orden en que se muestran
+_TOOL_CHECKS: Tuple[Callable[[], Tuple[str, str, str, str]], ...] = (
+    _check_pip,
+    _check_node,
+    _check_docker,
+    _check_git,
+)
+
+def doctor_command():
+    """Comando para diagnosticar el entorno de desarrollo"""
     
-    # Verificar conectividad (opcional)
-    console.print("\n[bold]🌐 Verificando Conectividad[/bold]")
+    console.print(Panel.fit(
+        "[bold cyan]🔍 Genesis Engine - Diagnóstico del Entorno[/bold cyan]",
+        border_style="cyan"
+    ))
     
+    checks = []
+
     try:
-        import requests
-        response = requests.get("https://api.github.com", timeout=5)
-        if response.status_code == 200:
-            rprint("[green]✅ Conectividad a GitHub: OK[/green]")
-        else:
-            rprint("[yellow]⚠️ Conectividad a GitHub: Limitada[/yellow]")
-    except Exception:
-        rprint("[red]❌ Conectividad a GitHub: Sin conexión[/red]")
+        check_dependencies()
+    except RuntimeError as exc:
+        rprint(f"[red]{exc}[/red]")
+        return False
+    
+    # Las verificaciones externas esperan a otros procesos o a la red: se lanzan
+    # todas juntas y cada resultado se recoge cuando hace falta mostrarlo
+    with ThreadPoolExecutor(max_workers=len(_TOOL_CHECKS) + 1) as executor:
+        tool_checks = [executor.submit(check) for check in _TOOL_CHECKS]
+        connectivity_check = executor.submit(_check_github_connectivity)
+        
+        # Crear tabla de resultados
+        table = Table(title="📋 Diagnóstico del Sistema")
+        table.add_column("Componente", style="cyan", no_wrap=True)
+        table.add_column("Estado", style="magenta")
+        table.add_column("Versión", style="green")
+        table.add_column("Notas", style="yellow")
+        
+        # 1. Verificar Python
+        checks.append(("Python", _PYTHON_STATUS, _PYTHON_VERSION, "Mínimo requerido: 3.8+"))
+        
+        # 2-5. Verificar pip, Node.js, Docker y Git
+        checks.extend(future.result() for future in tool_checks)
+        
+        # 6. Verificar Genesis Engine
+        try:
+            import genesis_engine
+            checks.append(("Genesis Engine", "✅ OK", genesis_engine.__version__, "¡Funcionando!"))
+        except ImportError:
+            checks.append(("Genesis Engine", "❌ Error", "N/A", "Problema de instalación"))
+        
+        # Agregar resultados a la tabla
+        for check in checks:
+            table.add_row(*check)
+        
+        console.print(table)
+        
+        # Verificar conectividad (opcional)
+        console.print("\n[bold]🌐 Verificando Conectividad[/bold]")
+        rprint(connectivity_check.result())
     
     # Información del sistema
-    console.print(f"\n[bold]💻 Sistema Operativo:[/bold] {platform.system()} {platform.release()}")
-    console.print(f"[bold]🏗️ Arquitectura:[/bold] {platform.machine()}")
+    system, release, machine = _system_info()
+    console.print(f"\n[bold]💻 Sistema Operativo:[/bold] {system} {release}")
+    console.print(f"[bold]🏗️ Arquitectura:[/bold] {machine}")
     
     # Verificar proyecto actual
     console.print("\n[bold]📁 Proyecto Actual[/bold]")
@@ -127,9 +176,7 @@ def doctor_command():
     if genesis_file.exists():
         rprint("[green]✅ Proyecto Genesis detectado[/green]")
         try:
-            import json
-            with open(genesis_file) as f:
-                config = json.load(f)
+            config = load_project_metadata(genesis_file)
             console.print(f"[cyan]📋 Nombre: {config.get('name', 'N/A')}[/cyan]")
             console.print(f"[cyan]🎯 Template: {config.get('template', 'N/A')}[/cyan]")
         except Exception:
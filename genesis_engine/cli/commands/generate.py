@@ -3,7 +3,6 @@
 Genesis Generate Command
 """
 
-import asyncio
 import inspect
 from uuid import uuid4
 
@@ -13,6 +12,7 @@ from rich.panel import Panel
 from genesis_engine.agents.backend import BackendAgent
 from genesis_engine.agents.devops import DevOpsAgent
 from genesis_engine.agents.frontend import FrontendAgent
+from genesis_engine.cli._runtime import run_async
 from genesis_engine.mcp.agent_base import AgentTask
 
 console = Console()
@@ -76,11 +76,11 @@ def generate_command(component: str, name: str, agent: str | None, interactive:
             result = await result
         return result
 
-    result = asyncio.run(_run_generate())
+    result = run_async(_run_generate())
 
     if isinstance(result, dict) and result.get("generated_files"):
-        console.print("[green]✅ Generación completada[/green]")
-        for f in result["generated_files"]:
-            console.print(f"📄 {f}")
+        lines = ["[green]✅ Generación completada[/green]"]
+        lines.extend(f"📄 {f}" for f in result["generated_files"])
+        console.print("\n".join(lines))
     else:
         console.print("[yellow]⚠️ Generación finalizó sin archivos" )
@@ -4,6 +4,7 @@ Genesis Init Command - Inicializar proyectos
 
 import json
 import asyncio
+import shutil
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -14,6 +15,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, ProjectGenerationRequest
 from genesis_engine.templates.engine import TemplateEngine
+from genesis_engine.cli._runtime import run_async
 
 import sys
 
@@ -22,6 +24,18 @@ real_module = sys.modules[__name__]
 
 console = Console()
 
+# Instrucciones que se muestran al terminar la inicialización
+_NEXT_STEPS = """[bold]🚀 Próximos pasos:[/bold]
+
+1. [cyan]cd {project_name}[/cyan]
+2. [cyan]genesis doctor[/cyan] - Verificar entorno
+3. [cyan]genesis deploy --env local[/cyan] - Desplegar localmente
+
+[bold]📋 Comandos útiles:[/bold]
+• [green]genesis status[/green] - Ver estado del proyecto
+• [green]genesis generate model User[/green] - Generar componentes
+• [green]genesis agents --list[/green] - Ver agentes disponibles"""
+
 def init_command(
     project_name: str,
     template: str = "saas-basic",
@@ -45,7 +59,8 @@ def init_command(
     project_dir = base_dir / project_name
     
     # Verificar si el directorio ya existe
-    if project_dir.exists():
+    project_existed = project_dir.exists()
+    if project_existed:
         if not no_interactive:
             overwrite = Confirm.ask(
                 f"[yellow]⚠️ El directorio '{project_name}' ya existe. ¿Sobrescribir?[/yellow]"
@@ -124,20 +139,16 @@ def init_command(
         template_engine = TemplateEngine()
         progress.update(task1, completed=1)
 
-        # Tarea 2: Generar arquitectura
+        # Tareas 2 y 3: la arquitectura y el código fuente no dependen entre sí,
+        # así que se generan a la vez
         task2 = progress.add_task("🏗️ Generando arquitectura del proyecto...", total=1)
+        task3 = progress.add_task("⚡ Generando código fuente...", total=1)
 
         request = ProjectGenerationRequest(
             name=project_name,
             template=template,
             options=project_config,
         )
-        architect_result = asyncio.run(orchestrator.execute_project_generation(request))
-
-        progress.update(task2, completed=1)
-        
-        # Tarea 3: Generar código
-        task3 = progress.add_task("⚡ Generando código fuente...", total=1)
         
         # Crear directorio del proyecto
         project_dir.mkdir(parents=True, exist_ok=True)
@@ -151,14 +162,38 @@ def init_command(
             "database_type": project_config.get("backend", {}).get("database", "postgresql"),
         }
 
-        # Generar archivos usando template engine
-        template_engine.generate_project(
-            template_name=template,
-            output_dir=project_dir,
-            context=context,
+        async def _generate_architecture():
+            result = await orchestrator.execute_project_generation(request)
+            progress.update(task2, completed=1)
+            return result
+
+        async def _generate_code():
+            # Generar archivos usando template engine (bloqueante: en un hilo)
+            await asyncio.to_thread(
+                template_engine.generate_project,
+                template_name=template,
+                output_dir=project_dir,
+                context=context,
+            )
+            progress.update(task3, completed=1)
+
+        async def _generate():
+            # Esperar siempre a ambos pasos: el render en un hilo no se puede
+            # cancelar si la arquitectura falla
+            return await asyncio.gather(
+                _generate_architecture(), _generate_code(), return_exceptions=True
+            )
+
+        architect_result, code_result = run_async(_generate())
+        error = next(
+            (r for r in (architect_result, code_result) if isinstance(r, BaseException)), None
         )
-        
-        progress.update(task3, completed=1)
+        if error is not None:
+            # No dejar un proyecto a medio generar
+            if not project_existed:
+                shutil.rmtree(project_dir, ignore_errors=True)
+            console.print(f"[red]❌ Error generando el proyecto: {error}[/red]")
+            raise error
         
         # Tarea 4: Configurar DevOps
         task4 = progress.add_task("🐳 Configurando DevOps...", total=1)
@@ -177,22 +212,14 @@ def init_command(
         
         progress.update(task5, completed=1)
     
-    # Mensaje de éxito
-    console.print(f"\n[bold green]✅ ¡Proyecto '{project_name}' creado exitosamente![/bold green]")
-    console.print(f"[cyan]📁 Ubicación: {project_dir}[/cyan]")
-    
-    # Instrucciones siguientes
-    console.print(Panel(
-        f"""[bold]🚀 Próximos pasos:[/bold]
-
-1. [cyan]cd {project_name}[/cyan]
-2. [cyan]genesis doctor[/cyan] - Verificar entorno
-3. [cyan]genesis deploy --env local[/cyan] - Desplegar localmente
-
-[bold]📋 Comandos útiles:[/bold]
-• [green]genesis status[/green] - Ver estado del proyecto
-• [green]genesis generate model User[/green] - Generar componentes
-• [green]genesis agents --list[/green] - Ver agentes disponibles""",
-        title="[bold green]Proyecto Listo[/bold green]",
-        border_style="green"
-    ))
\ No newline at end of file
+    # Mensaje de éxito: se escribe en la terminal de una sola vez al salir del bloque
+    with console:
+        console.print(f"\n[bold green]✅ ¡Proyecto '{project_name}' creado exitosamente![/bold green]")
+        console.print(f"[cyan]📁 Ubicación: {project_dir}[/cyan]")
+        
+        # Instrucciones siguientes
+        console.print(Panel(
+            _NEXT_STEPS.format(project_name=project_name),
+            title="[bold green]Proyecto Listo[/bold green]",
+            border_style="green"
+        ))
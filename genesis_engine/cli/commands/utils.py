@@ -2,14 +2,23 @@
 Utilidades para CLI
 """
 
+import json
 import sys
 import subprocess
+from pathlib import Path
+from typing import Any, Dict
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from genesis_engine import __version__
 
+try:  # pragma: no cover - opcional según entorno
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 console = Console()
 
 def show_banner():
@@ -27,6 +36,13 @@ def show_banner():
         padding=(1, 2)
     ))
 
+def load_project_metadata(genesis_file: Path) -> Dict[str, Any]:
+    """Cargar genesis.json (orjson si está disponible)"""
+    data = genesis_file.read_bytes()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def check_dependencies() -> bool:
     """Verificar dependencias básicas.
 
@@ -42,9 +58,9 @@ def check_dependencies() -> bool:
 
     def _check(cmd, name):
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
             return result.returncode == 0
-        except FileNotFoundError:
+        except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
     if not _check(["node", "--version"], "Node.js"):
@@ -4,7 +4,6 @@ Genesis Engine CLI - Entry Point Principal
 """
 
 import sys
-import asyncio
 import json
 import os
 from pathlib import Path
@@ -24,6 +23,7 @@ from genesis_engine.core.exceptions import GenesisException, ProjectCreationErro
 from genesis_core.orchestrator.core_orchestrator import CoreOrchestrator, ProjectGenerationRequest
 from genesis_engine.core.config import initialize
 from genesis_engine.core.logging import get_logger
+from genesis_engine.cli._runtime import run_async
 from genesis_engine import __version__
 
 # Configurar Rich Console
@@ -286,7 +286,7 @@ def init(
             task = progress.add_task("Inicializando orquestador...", total=None)
             
             # Crear y ejecutar orquestador
-            result = asyncio.run(_create_project_async(config, progress, task))
+            result = run_async(_create_project_async(config, progress, task))
             
             if result.success:
                 console.print(f"\n[bold green][PASS] Proyecto '{project_name}' creado exitosamente![/bold green]")
@@ -453,7 +453,7 @@ def deploy(
             "auto_migrate": auto_migrate
         }
         
-        result = asyncio.run(_deploy_async(config))
+        result = run_async(_deploy_async(config))
         
         if result.get("success"):
             console.print(f"[bold green][PASS] Despliegue exitoso en {environment}[/bold green]")
@@ -552,7 +552,7 @@ def generate(
         }
         
         # Ejecutar generación
-        result = asyncio.run(_generate_async(config))
+        result = run_async(_generate_async(config))
         
         if result.get("success"):
             console.print(f"[bold green][PASS] {component.capitalize()} '{name}' generado exitosamente[/bold green]")
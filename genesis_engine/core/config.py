@@ -28,6 +28,17 @@ except ImportError:
     HAS_RICH = False
 
 
+# Stacks predefinidos por template (ver "Plantillas Disponibles" en el README)
+_STACK_PRESETS: Dict[str, Dict[str, str]] = {
+    "golden-path": {
+        "backend": "fastapi",
+        "frontend": "nextjs",
+        "database": "postgresql",
+        "cache": "redis",
+    },
+}
+
+
 class Features(str, Enum):
     """Available optional project features."""
 
@@ -190,6 +201,11 @@ class GenesisConfig:
         """Return supported frameworks for a component from the global config."""
         return get_config()._get_supported_frameworks(component)
 
+    @classmethod
+    def get_stack_config(cls, name: str) -> Dict[str, str]:
+        """Return a copy of the predefined stack for a template."""
+        return dict(_STACK_PRESETS.get(name, {}))
+
     @classmethod
     def set(cls, key: str, value: Any):
         """Set a configuration value on the global instance."""
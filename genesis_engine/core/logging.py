@@ -149,56 +149,68 @@ def setup_logging(level: str = "INFO", enable_rich: bool = True) -> logging.Logg
     
     return genesis_logger
 
+# Emojis -> prefijos ASCII usados por safe_log_message
+_EMOJI_REPLACEMENTS = {
+    '🚀': '[INIT]',
+    '✅': '[OK]',
+    '❌': '[ERROR]',
+    '🔄': '[EXEC]',
+    '⚠️': '[WARN]',
+    '🎯': '[TARGET]',
+    '🔧': '[FIX]',
+    '📝': '[DOC]',
+    '🔍': '[SCAN]',
+    '⚡': '[FAST]',
+    '🏗️': '[BUILD]',
+    '🎨': '[UI]',
+    '🐳': '[DOCKER]',
+    '☸️': '[K8S]',
+    '📊': '[METRICS]',
+    '🔥': '[HOT]',
+    '💾': '[SAVE]',
+    '🛑': '[STOP]',
+    '🎼': '[ORCH]',
+    '🤖': '[AGENT]',
+    '📋': '[LIST]',
+    '📄': '[FILE]',
+    '🎯': '[GOAL]',
+    '🛠️': '[TOOL]',
+    '📈': '[GROWTH]',
+    '🔐': '[SECURE]',
+    '⏰': '[TIME]',
+    '💡': '[IDEA]',
+    '🌟': '[STAR]',
+    '🚨': '[ALERT]',
+    '🔬': '[TEST]',
+    '📚': '[DOCS]',
+    '🎪': '[DEMO]',
+    '🏆': '[SUCCESS]',
+    '🎊': '[COMPLETE]'
+}
+
+
 def safe_log_message(message: str) -> str:
     """
     NUEVA FUNCIÓN: Convertir mensaje a ASCII-safe
     
     Reemplaza emojis por prefijos de texto para evitar encoding issues
     """
-    emoji_replacements = {
-        '🚀': '[INIT]',
-        '✅': '[OK]',
-        '❌': '[ERROR]',
-        '🔄': '[EXEC]',
-        '⚠️': '[WARN]',
-        '🎯': '[TARGET]',
-        '🔧': '[FIX]',
-        '📝': '[DOC]',
-        '🔍': '[SCAN]',
-        '⚡': '[FAST]',
-        '🏗️': '[BUILD]',
-        '🎨': '[UI]',
-        '🐳': '[DOCKER]',
-        '☸️': '[K8S]',
-        '📊': '[METRICS]',
-        '🔥': '[HOT]',
-        '💾': '[SAVE]',
-        '🛑': '[STOP]',
-        '🎼': '[ORCH]',
-        '🤖': '[AGENT]',
-        '📋': '[LIST]',
-        '📄': '[FILE]',
-        '🎯': '[GOAL]',
-        '🛠️': '[TOOL]',
-        '📈': '[GROWTH]',
-        '🔐': '[SECURE]',
-        '⏰': '[TIME]',
-        '💡': '[IDEA]',
-        '🌟': '[STAR]',
-        '🚨': '[ALERT]',
-        '🔬': '[TEST]',
-        '📚': '[DOCS]',
-        '🎪': '[DEMO]',
-        '🏆': '[SUCCESS]',
-        '🎊': '[COMPLETE]'
-    }
-    
+    # Los emojis no son ASCII: la mayoría de mensajes no necesita reemplazos
+    if message.isascii():
+        return message
+
     safe_message = message
-    for emoji, replacement in emoji_replacements.items():
+    for emoji, replacement in _EMOJI_REPLACEMENTS.items():
         safe_message = safe_message.replace(emoji, replacement)
     
     return safe_message
 
+class SafeLoggerAdapter(logging.LoggerAdapter):
+    """Adapter que convierte emojis a prefijos ASCII (solo para registros emitidos)"""
+
+    def process(self, msg, kwargs):
+        return safe_log_message(str(msg)), kwargs
+
 def get_safe_logger(name: str = "genesis_engine") -> logging.Logger:
     """
     NUEVA FUNCIÓN: Obtener logger con mensajes ASCII-safe
@@ -206,11 +218,6 @@ def get_safe_logger(name: str = "genesis_engine") -> logging.Logger:
     Wrapper que automáticamente convierte emojis a prefijos ASCII
     """
     base_logger = get_logger(name)
-    
-    class SafeLoggerAdapter(logging.LoggerAdapter):
-        def process(self, msg, kwargs):
-            return safe_log_message(str(msg)), kwargs
-    
     return SafeLoggerAdapter(base_logger, {})
 
 # CORRECCIÓN: Configurar logging básico al importar el módulo con manejo de errores
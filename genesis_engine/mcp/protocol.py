@@ -32,8 +32,32 @@ from genesis_engine.mcp.message_types import (
 )
 from genesis_engine.core.logging import get_logger
 
+try:  # pragma: no cover - opcional según entorno
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
+
+def _json_dumps(data: Any) -> bytes:
+    """Serializar a JSON compacto en UTF-8 (orjson si está disponible)"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Tipos que orjson no soporta (p.ej. enteros > 64 bits): usar json
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parsear JSON desde bytes UTF-8 (orjson si está disponible)"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
 class ConnectionState(str, Enum):
     """Estados de conexión"""
     CONNECTED = "connected"
@@ -203,7 +227,7 @@ class MCPMessageValidator:
         # Validar tamaño del payload
         if hasattr(message, 'data') and message.data:
             try:
-                serialized = json.dumps(message.data)
+                serialized = _json_dumps(message.data)
                 if len(serialized) > 1024 * 1024:  # 1MB
                     warnings.append("Payload muy grande (>1MB)")
             except (TypeError, ValueError):
@@ -264,9 +288,8 @@ class MCPMessageSerializer:
                     "details": message.details
                 })
             
-            # Serializar a JSON y luego a bytes
-            json_str = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-            return json_str.encode('utf-8')
+            # Serializar directamente a bytes JSON
+            return _json_dumps(data)
             
         except Exception as e:
             logger.error(f"Error serializando mensaje: {e}")
@@ -276,9 +299,8 @@ class MCPMessageSerializer:
     def deserialize(data: bytes) -> MCPMessage:
         """Deserializar bytes a mensaje"""
         try:
-            # Decodificar y parsear JSON
-            json_str = data.decode('utf-8')
-            obj = json.loads(json_str)
+            # Parsear JSON directamente desde bytes
+            obj = _json_loads(data)
             
             # Convertir timestamp
             if 'timestamp' in obj:
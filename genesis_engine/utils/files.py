@@ -0,0 +1,53 @@
+"""
+File Utilities - Escritura de archivos compartida por los agentes de Genesis Engine
+
+Este módulo proporciona:
+- Escritura directa a descriptor, sin la capa de buffers de io
+- Creación de directorios una sola vez por proceso
+"""
+
+import os
+from pathlib import Path
+from typing import Set
+
+# Escritura directa a descriptor (O_BINARY evita traducir saltos de línea en Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Directorios ya creados por este proceso (evita un mkdir por cada escritura)
+_ENSURED_DIRS: Set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Crear un directorio solo la primera vez que se necesita en el proceso"""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def write_bytes(path: Path, data: bytes, create_dirs: bool = False) -> None:
+    """
+    Escribir bytes con un único open/write/close
+
+    Con create_dirs=True se crea el directorio padre si hace falta (y se vuelve
+    a crear si se borró después); si no, el llamador debe garantizar que existe.
+    """
+    if create_dirs:
+        ensure_dir(path.parent)
+    try:
+        fd = os.open(os.fspath(path), _WRITE_FLAGS, 0o644)
+    except FileNotFoundError:
+        if not create_dirs:
+            raise
+        # El directorio se borró después de crearlo
+        _ENSURED_DIRS.discard(path.parent)
+        ensure_dir(path.parent)
+        fd = os.open(os.fspath(path), _WRITE_FLAGS, 0o644)
+    try:
+        # Caso habitual: una sola llamada escribe todo el contenido
+        written = os.write(fd, data)
+        if written < len(data):
+            view = memoryview(data)[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -7,6 +7,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 
+import httpx
 import yaml  # ensure PyYAML is available
 
 
@@ -14,6 +15,32 @@ from genesis_engine.cli.main import app
 from genesis_engine.cli import commands as cmd_modules
 
 
+def _fake_client(status_codes, calls=None):
+    """Cliente httpx falso que responde con los códigos dados, en orden"""
+    codes = iter(status_codes)
+    calls = [] if calls is None else calls
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def head(self, url):
+            calls.append(('HEAD', url))
+            return types.SimpleNamespace(status_code=next(codes))
+
+        def get(self, url):
+            calls.append(('GET', url))
+            return types.SimpleNamespace(status_code=next(codes))
+
+    return FakeClient
+
+
 def test_genesis_help():
     runner = CliRunner()
     result = runner.invoke(app, ['--help'])
@@ -29,8 +56,23 @@ def test_genesis_doctor(monkeypatch):
 
     monkeypatch.setattr(cmd_modules.doctor.subprocess, 'run', dummy_run)
     monkeypatch.setattr(cmd_modules.utils.subprocess, 'run', dummy_run)
-    import requests
-    monkeypatch.setattr(requests, 'get', lambda *a, **kw: types.SimpleNamespace(status_code=200))
+    monkeypatch.setattr(httpx, 'Client', _fake_client([200]))
 
     result = runner.invoke(app, ['doctor'])
     assert result.exit_code == 0
+
+
+def test_github_connectivity_uses_head(monkeypatch):
+    calls = []
+    monkeypatch.setattr(httpx, 'Client', _fake_client([200], calls))
+
+    assert 'OK' in cmd_modules.doctor._check_github_connectivity()
+    assert [method for method, _ in calls] == ['HEAD']
+
+
+def test_github_connectivity_falls_back_to_get_on_405(monkeypatch):
+    calls = []
+    monkeypatch.setattr(httpx, 'Client', _fake_client([405, 200], calls))
+
+    assert 'OK' in cmd_modules.doctor._check_github_connectivity()
+    assert [method for method, _ in calls] == ['HEAD', 'GET']
@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from genesis_engine.utils.files import write_bytes
+
+
+def test_write_bytes_recreates_removed_directory(tmp_path):
+    report = tmp_path / ".genesis" / "report.md"
+    write_bytes(report, "primero".encode("utf-8"), create_dirs=True)
+    report.unlink()
+    report.parent.rmdir()
+    write_bytes(report, "ñ".encode("utf-8"), create_dirs=True)
+    assert report.read_text(encoding="utf-8") == "ñ"
+
+
+def test_write_bytes_without_create_dirs_requires_parent(tmp_path):
+    target = tmp_path / "missing" / "file.txt"
+    with pytest.raises(FileNotFoundError):
+        write_bytes(target, b"data")
+
+    target.parent.mkdir()
+    write_bytes(target, b"data")
+    write_bytes(target, b"new")
+    assert target.read_bytes() == b"new"
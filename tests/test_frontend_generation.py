@@ -1,11 +1,16 @@
 from pathlib import Path
 import sys
 import json
+import asyncio
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-from genesis_engine.agents.frontend import FrontendAgent
+from genesis_engine.agents import frontend
+from genesis_engine.agents.frontend import FrontendAgent, FrontendFramework
+from genesis_engine.core import config as genesis_config
 from genesis_templates.engine import TemplateEngine
 from importlib import resources
 
@@ -24,7 +29,7 @@ def test_generate_react_frontend(tmp_path):
     agent = make_agent()
     schema = {"project_name": "DemoApp", "description": "Demo"}
     params = {"schema": schema, "framework": "react", "output_path": tmp_path}
-    result = agent._generate_complete_frontend(params)
+    result = asyncio.run(agent._generate_complete_frontend(params))
 
     expected = {
         tmp_path / "package.json",
@@ -46,9 +51,171 @@ def test_generate_nextjs_package_json_contains_next(tmp_path):
     agent = make_agent()
     schema = {"project_name": "DemoNext", "description": "Demo"}
     params = {"schema": schema, "framework": "nextjs", "output_path": tmp_path}
-    result = agent._generate_complete_frontend(params)
+    result = asyncio.run(agent._generate_complete_frontend(params))
 
     package_json = tmp_path / "package.json"
     data = json.loads(package_json.read_text())
     assert "next" in data.get("dependencies", {})
 
+
+def test_extract_frontend_config_returns_independent_copies():
+    agent = make_agent()
+    params = {"framework": "react", "features": ["auth"], "env_vars": {"A": "1"}}
+
+    first = agent._extract_frontend_config(params)
+    first.features.append("poison")
+    first.environment_vars["B"] = "2"
+    first.framework = FrontendFramework.VUE
+
+    second = agent._extract_frontend_config(params)
+    assert second is not first
+    assert second.features == ["auth"]
+    assert second.environment_vars == {"A": "1"}
+    assert second.framework == FrontendFramework.REACT
+
+
+def test_injected_template_engine_is_not_reconfigured():
+    agent = make_agent()
+    env = getattr(agent.template_engine, "env", None)
+    if env is None:
+        pytest.skip("TemplateEngine sin Environment de Jinja")
+    assert env.auto_reload
+    assert env.bytecode_cache is None
+
+
+def test_render_template_does_not_memoize_injected_engines():
+    class CountingEngine:
+        def __init__(self):
+            self.calls = 0
+
+        def render_template(self, name, variables):
+            self.calls += 1
+            return f"{name}:{self.calls}"
+
+    agent = make_agent()
+    agent.template_engine = CountingEngine()
+    first = agent._render_template("a.j2", {"x": 1})
+    second = agent._render_template("a.j2", {"x": 1})
+    assert (first, second) == (b"a.j2:1", b"a.j2:2")
+
+
+def test_bytecode_cache_uses_configured_cache_dir(tmp_path, monkeypatch):
+    cfg = genesis_config.GenesisConfig(config_dir=tmp_path, cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(genesis_config, "_config_instance", cfg)
+    engine = frontend._configure_template_engine(TemplateEngine())
+    if getattr(engine, "env", None) is None:
+        pytest.skip("TemplateEngine sin Environment de Jinja")
+    assert engine.env.bytecode_cache.directory == str(tmp_path / "cache" / "jinja")
+
+
+def test_drain_write_queue_merges_batches_in_order(tmp_path):
+    agent = make_agent()
+    shared = tmp_path / "shared.txt"
+    first_only = tmp_path / "sub" / "first.txt"
+
+    async def drain():
+        queue = asyncio.Queue()
+        queue.put_nowait({shared: b"first", first_only: b"only"})
+        queue.put_nowait({shared: b"second"})
+        queue.put_nowait(None)
+        await agent._drain_write_queue(queue)
+
+    asyncio.run(drain())
+    assert shared.read_bytes() == b"second"
+    assert first_only.read_bytes() == b"only"
+
+
+def test_flush_batch_creates_each_directory_once(tmp_path, monkeypatch):
+    agent = make_agent()
+    created = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self, *args, **kwargs):
+        created.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+    created_dirs = {tmp_path}
+
+    async def flush():
+        await agent._flush_batch(
+            {tmp_path / "a" / "1.txt": b"1", tmp_path / "a" / "2.txt": b"2", tmp_path / "x.txt": b"x"},
+            created_dirs,
+        )
+        await agent._flush_batch({tmp_path / "a" / "3.txt": b"3"}, created_dirs)
+
+    asyncio.run(flush())
+    assert created == [tmp_path / "a"]
+    assert (tmp_path / "a" / "3.txt").read_bytes() == b"3"
+
+
+def test_generated_files_are_unique_and_last_step_wins(tmp_path):
+    agent = make_agent()
+    schema = {"project_name": "DemoNext", "description": "Demo"}
+    params = {"schema": schema, "framework": "nextjs", "output_path": tmp_path}
+    result = asyncio.run(agent._generate_complete_frontend(params))
+
+    generated = result["generated_files"]
+    assert len(generated) == len(set(generated))
+
+    # app/page.tsx lo escribe la aplicación principal y luego lo reemplazan las páginas de Next.js
+    config = agent._extract_frontend_config(params)
+    pages = agent._generate_nextjs_pages(config, tmp_path)
+    page = tmp_path / "app" / "page.tsx"
+    assert page in pages
+    assert page.read_bytes() == pages[page]
+
+
+def test_memoized_config_and_renders_follow_params(monkeypatch):
+    class CountingEngine:
+        def __init__(self):
+            self.calls = 0
+
+        def render_template(self, name, variables):
+            self.calls += 1
+            return f"{name}:{variables['project_name']}"
+
+    engine = CountingEngine()
+    monkeypatch.setattr(frontend, "_get_shared_template_engine", lambda: engine)
+    frontend._render_shared_cached.cache_clear()
+    try:
+        agent = make_agent()
+        agent.template_engine = engine
+        assert agent._render_template("t.j2", {"project_name": "a"}) == b"t.j2:a"
+        assert agent._render_template("t.j2", {"project_name": "b"}) == b"t.j2:b"
+        assert agent._render_template("t.j2", {"project_name": "a"}) == b"t.j2:a"
+        assert engine.calls == 2
+    finally:
+        frontend._render_shared_cached.cache_clear()
+
+    react = agent._extract_frontend_config({"framework": "react", "features": ["auth"]})
+    vue = agent._extract_frontend_config({"framework": "vue", "features": ["billing"]})
+    assert (react.framework.value, react.features) == ("react", ["auth"])
+    assert (vue.framework.value, vue.features) == ("vue", ["billing"])
+
+
+def test_render_memo_key_keeps_value_types(monkeypatch):
+    class RecordingEngine:
+        def __init__(self):
+            self.seen = []
+
+        def render_template(self, name, variables):
+            self.seen.append(dict(variables))
+            return repr(variables["typescript"])
+
+    engine = RecordingEngine()
+    monkeypatch.setattr(frontend, "_get_shared_template_engine", lambda: engine)
+    frontend._render_shared_cached.cache_clear()
+    try:
+        agent = make_agent()
+        agent.template_engine = engine
+        # True y 1 son iguales como clave de dict, pero no deben compartir render
+        assert agent._render_template("t.j2", {"typescript": True}) == b"True"
+        assert agent._render_template("t.j2", {"typescript": 1}) == b"1"
+        # Las listas no se memoizan y llegan al engine sin convertir
+        agent._render_template("t.j2", {"typescript": True, "features": ["auth"]})
+        assert engine.seen[-1]["features"] == ["auth"]
+        assert type(engine.seen[-1]["features"]) is list
+        assert len(engine.seen) == 3
+    finally:
+        frontend._render_shared_cached.cache_clear()
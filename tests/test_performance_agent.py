@@ -5,6 +5,7 @@ import pytest
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from genesis_engine.agents import performance
 from genesis_engine.agents.performance import PerformanceAgent
 
 
@@ -54,3 +55,103 @@ async def test_setup_monitoring_creates_config(tmp_path):
     assert result["optimizations"]
     assert result["files_modified"] == [str(config)]
     assert config.exists()
+
+
+@pytest.mark.asyncio
+async def test_analyze_python_file_detects_patterns(tmp_path):
+    file = tmp_path / "service.py"
+    file.write_text(
+        "def run(items, db):\n"
+        "    out = ''\n"
+        "    for item in items:\n"
+        "        db.query(item) or db.get(item)\n"
+        "        out += str(len(items))\n"
+        "    eval('1+1')\n"
+        "    return 'SELECT * FROM t WHERE id = %s' % out\n"
+    )
+    agent = make_agent()
+    issues = await agent._analyze_python_file(file)
+    found = {(issue.description, issue.line_number) for issue in issues}
+    assert ("Llamada a len() dentro de bucle", 3) in found
+    assert ("Concatenación de strings en bucle", 5) in found
+    assert ("Posible problema N+1 en consultas de base de datos", 4) in found
+    assert ("Uso de eval() - riesgo de seguridad", 6) in found
+    assert ("Posible SQL injection - query no parametrizada", 7) in found
+    assert len(issues) == 5
+
+
+@pytest.mark.asyncio
+async def test_analyze_project_performance_process_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(performance, "_PROCESS_POOL_MIN_FILES", 1)
+    (tmp_path / "a.py").write_text("eval('1')\n")
+    (tmp_path / "b.js").write_text("console.log('x')\n")
+    (tmp_path / "broken.py").write_text("def (:\n")
+    agent = make_agent()
+    result = await agent._analyze_project_performance({"project_path": tmp_path})
+    assert result["files_analyzed"] == 3
+    assert sorted(Path(i.file_path).name for i in result["detected_issues"]) == ["a.py", "b.js"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_project_performance_reuses_cache(tmp_path, monkeypatch):
+    file = tmp_path / "a.py"
+    file.write_text("eval('1')\n")
+    agent = make_agent()
+    first = await agent._analyze_project_performance({"project_path": tmp_path})
+    assert (tmp_path / ".genesis" / "analysis_cache.json").exists()
+
+    def fail(*args):
+        raise AssertionError("archivo sin cambios reanalizado")
+
+    monkeypatch.setattr(performance, "_analyze_python_source", fail)
+    second = await agent._analyze_project_performance({"project_path": tmp_path})
+    assert second["detected_issues"] == first["detected_issues"]
+
+
+def test_find_source_files_skips_dependencies(tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "main.py").write_text("")
+    (tmp_path / "web.tsx").write_text("")
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.js").write_text("")
+    python_files, js_files = performance._find_source_files(tmp_path)
+    assert python_files == [tmp_path / "app" / "main.py"]
+    assert js_files == [tmp_path / "web.tsx"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_files_reuses_session_results(tmp_path, monkeypatch):
+    file = tmp_path / "a.py"
+    file.write_text("eval('1')\n")
+    agent = make_agent()
+    params = {"project_path": tmp_path, "use_cache": False}
+    first = await agent._analyze_project_performance(params)
+
+    def fail(*args):
+        raise AssertionError("archivo sin cambios reanalizado")
+
+    monkeypatch.setattr(performance, "_analyze_python_source", fail)
+    second = await agent._analyze_project_performance(params)
+    assert second["detected_issues"] == first["detected_issues"]
+    assert not (tmp_path / ".genesis" / "analysis_cache.json").exists()
+
+
+def test_analyze_python_complexity():
+    code = (
+        "class A:\n"
+        "    def f(self, xs):\n"
+        "        for x in xs:\n"
+        "            if x:\n"
+        "                pass\n"
+        "def g():\n"
+        "    while True:\n"
+        "        break\n"
+    )
+    assert PerformanceAgent.analyze_python_complexity(code) == {
+        "cyclomatic_complexity": 4,
+        "function_count": 2,
+        "class_count": 1,
+        "max_depth": 2,
+    }
+    assert "error" in PerformanceAgent.analyze_python_complexity("def (")
+
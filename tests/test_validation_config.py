@@ -28,3 +28,12 @@ def test_stack_validation_reflects_genesis_config():
         assert any(r.name == "Stack: backend" and r.level == ValidationLevel.SUCCESS for r in results)
     finally:
         GenesisConfig.set("supported_frameworks.backend", original)
+
+
+def test_get_stack_config_returns_independent_copy():
+    stack = GenesisConfig.get_stack_config("golden-path")
+    assert stack["backend"] == "fastapi"
+
+    stack["backend"] = "django"
+    assert GenesisConfig.get_stack_config("golden-path")["backend"] == "fastapi"
+    assert GenesisConfig.get_stack_config("unknown") == {}